@@ -150,6 +150,15 @@ class AdmissionsSystem:
         """
         return self._students.get(student_id)
     
+    def get_students_bulk(self, student_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieve several student records in one call (missing IDs omitted).
+        
+        PRODUCTION: One SOAP batch request (GetStudentsRequest)
+        """
+        students = self._students
+        return {sid: students[sid] for sid in student_ids if sid in students}
+    
     def get_all_students(self) -> List[Dict]:
         """Get all student records."""
         return list(self._students.values())
@@ -266,6 +275,15 @@ class AcademicRecordsSystem:
         """
         return self._records.get(student_id)
     
+    def get_academic_records_bulk(self, student_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieve several academic records in one call (missing IDs omitted).
+        
+        PRODUCTION: ... WHERE EMPLID IN (:student_ids)
+        """
+        records = self._records
+        return {sid: records[sid] for sid in student_ids if sid in records}
+    
     def get_transcript(self, student_id: str) -> Optional[Dict]:
         """Get official transcript data."""
         record = self._records.get(student_id)
@@ -414,6 +432,15 @@ class FinancialAidSystem:
         """
         return self._financial_aid.get(student_id)
     
+    def get_financial_aid_bulk(self, student_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieve several aid packages in one call (missing IDs omitted).
+        
+        PRODUCTION: GET /api/v1/financial-aid?student_ids=...
+        """
+        packages = self._financial_aid
+        return {sid: packages[sid] for sid in student_ids if sid in packages}
+    
     def get_disbursement_schedule(self, student_id: str) -> List[Dict]:
         """Get disbursement schedule for student."""
         aid = self._financial_aid.get(student_id)
@@ -531,6 +558,15 @@ class HousingSystem:
         X-Signature: {hmac_signature}
         """
         return self._housing.get(student_id)
+    
+    def get_housing_bulk(self, student_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Retrieve several housing assignments in one call (missing IDs omitted).
+        
+        PRODUCTION: POST /api/housing/assignments/query {"student_ids": [...]}
+        """
+        assignments = self._housing
+        return {sid: assignments[sid] for sid in student_ids if sid in assignments}
 
 
 class DirectoryServices:
@@ -686,6 +722,11 @@ class LibrarySystem:
     def get_library_account(self, student_id: str) -> Optional[Dict]:
         """Get library account info."""
         return self._accounts.get(student_id)
+    
+    def get_library_accounts_bulk(self, student_ids: List[str]) -> Dict[str, Dict]:
+        """Get several library accounts in one call (missing IDs omitted)."""
+        accounts = self._accounts
+        return {sid: accounts[sid] for sid in student_ids if sid in accounts}
 
 
 # Singleton instances for the legacy systems
@@ -33,9 +33,13 @@ ARCHITECTURE:
 ================================================================================
 """
 
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
-import hashlib
+from itertools import islice
+from typing import Deque, Dict, List, Optional
+
+# Seed users are hashed with the same scheme AuthService verifies
+from app.services.auth_service import simple_hash
 
 # Import legacy system connectors
 from app.data.legacy_systems import (
@@ -47,14 +51,26 @@ from app.data.legacy_systems import (
     get_all_legacy_systems
 )
 
-# Simple password hashing for MVP (no external dependencies)
-def simple_hash(password: str) -> str:
-    """Simple SHA-256 hash for MVP demo. NOT for production use."""
-    return hashlib.sha256(password.encode()).hexdigest()
+# Query log entries kept in memory (oldest evicted first)
+# PRODUCTION: Cosmos DB with a 90-day retention policy
+QUERY_LOG_RETENTION = 50_000
+
+# Ticket notifications kept in the simulated outbox (oldest evicted first)
+NOTIFICATION_RETENTION = 10_000
+
 
-def simple_verify(password: str, hashed: str) -> bool:
-    """Verify password against simple hash."""
-    return simple_hash(password) == hashed
+# Public (non-sensitive) user fields exposed by the admin user directory,
+# paired with the default used when a user record omits the field.
+USER_DIRECTORY_FIELDS = (
+    ("username", None),
+    ("name", "Unknown"),
+    ("role", "student"),
+    ("department", None),
+    ("student_id", None),
+    ("is_active", True),
+    ("created_at", None),
+    ("last_login", None),
+)
 
 
 class MockDatabase:
@@ -72,6 +88,7 @@ class MockDatabase:
     ║  self.users        → Active Directory/LDAP (ON-PREMISE)       ║
     ║  self.query_log    → Analytics DB (CLOUD - Azure Cosmos)      ║
     ║  self.knowledge_base → CMS/Vector DB (CLOUD)                  ║
+    ║  self.tickets      → CRM ticketing (ServiceNow/Salesforce)    ║
     ╚════════════════════════════════════════════════════════════════╝
     """
     
@@ -79,8 +96,14 @@ class MockDatabase:
         """Initialize all mock data stores."""
         self._init_students()
         self._init_users()
+        self._build_user_directory()
         self._init_knowledge_base()
-        self.query_log: List[Dict] = []
+        self.query_log: Deque[Dict] = deque(maxlen=QUERY_LOG_RETENTION)
+        self._logged_count = 0  # Total ever logged, including evicted entries
+        # Support tickets, filled and indexed by EscalationService
+        self.tickets: Dict[str, Dict] = {}
+        self.ticket_seq = 0  # Last ticket number issued
+        self.notifications: Deque[Dict] = deque(maxlen=NOTIFICATION_RETENTION)
     
     def _init_students(self):
         """
@@ -296,6 +319,23 @@ class MockDatabase:
             }
         }
     
+    def _build_user_directory(self):
+        """
+        Build a column-oriented copy of the public user fields.
+        
+        Stored as parallel lists (structure-of-arrays), one per field in
+        USER_DIRECTORY_FIELDS, so listing users is a zip over columns
+        instead of ~8 dict lookups per user per request. Passwords are
+        never copied into the directory.
+        
+        Must be rebuilt whenever self.users is mutated.
+        """
+        users = list(self.users.values())
+        self.user_directory: Dict[str, List] = {
+            field: [user.get(field, default) for user in users]
+            for field, default in USER_DIRECTORY_FIELDS
+        }
+    
     def _init_knowledge_base(self):
         """
         Initialize FAQ/Knowledge Base content.
@@ -396,7 +436,21 @@ class MockDatabase:
     def log_query(self, log_entry: Dict):
         """Add entry to query log."""
         self.query_log.append(log_entry)
+        self._logged_count += 1
+    
+    def log_batch(self, log_entries: List[Dict]):
+        """Add several entries to query log in one write."""
+        self.query_log.extend(log_entries)
+        self._logged_count += len(log_entries)
+    
+    def logged_count(self) -> int:
+        """Total number of queries logged."""
+        return self._logged_count
     
     def get_query_log(self, limit: int = 50) -> List[Dict]:
-        """Get recent query log entries."""
-        return self.query_log[-limit:] if self.query_log else []
+        """Get the most recent query log entries, oldest first."""
+        if limit <= 0:
+            return []
+        entries = list(islice(reversed(self.query_log), limit))
+        entries.reverse()
+        return entries
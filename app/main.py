@@ -36,19 +36,31 @@ ESB (Enterprise Service Bus) ROLE:
 ================================================================================
 """
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+from collections import Counter
+from contextlib import asynccontextmanager
 from typing import Dict
 from datetime import datetime
+import gzip
+import hashlib
 import os
 
+import orjson
+from pydantic import ValidationError
+
 # Import all service modules (separation of concerns)
 from app.services.auth_service import AuthService, oauth2_scheme
 from app.services.ai_service import AIService
-from app.services.esb_service import ESBService
+from app.services.esb_service import ESBService, UNAVAILABLE_ERRORS
 from app.services.analytics_service import AnalyticsService
 from app.services.rbac_service import RBACService, Role, Permission
 from app.services.escalation_service import EscalationService, TicketStatus
@@ -56,9 +68,37 @@ from app.data.mock_database import MockDatabase
 from app.data.legacy_systems import get_all_legacy_systems
 from app.models.schemas import (
     Token, QueryRequest, QueryResponse, 
-    StudentModel, AnalyticsMetrics
+    StudentModel, AnalyticsMetrics,
+    QUERY_REQUEST_ADAPTER, QUERY_RESPONSE_ADAPTER,
+    ANALYTICS_ADAPTER
 )
 
+# ================================================================================
+# APPLICATION LIFECYCLE
+# ================================================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manage process-wide resources for the lifetime of the application.
+    
+    PRODUCTION: Open one shared async HTTP client here (pooled keep-alive
+    connections) once ESB connectors call real subsystem APIs; the MVP
+    connectors are in-process lookups, so none is created.
+    
+    The analytics log writer and the ticket notifier threads run only
+    while the app is up. On shutdown they are stopped, query log entries
+    still queued are flushed to the database, pending ticket notifications
+    are sent, and the ESB's per-system worker pools are shut down.
+    """
+    analytics_service.start_log_writer()
+    escalation_service.start_notifier()
+    yield
+    analytics_service.stop_log_writer()
+    escalation_service.stop_notifier()
+    esb_service.close()
+
+
 # ================================================================================
 # APPLICATION INITIALIZATION
 # ================================================================================
@@ -87,7 +127,9 @@ app = FastAPI(
     """,
     version="1.0.0-MVP",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson encoding for all JSON routes
+    lifespan=lifespan
 )
 
 # ================================================================================
@@ -105,6 +147,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+"""
+Responses of 500 bytes or more are gzip-compressed when the client's
+Accept-Encoding allows gzip (admin, analytics, knowledge-base and ticket
+payloads). Responses that already carry a Content-Encoding header are
+passed through.
+PRODUCTION NOTE: Brotli is usually offloaded to the CDN / reverse proxy.
+"""
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    True if an Accept-Encoding header allows gzip.
+    
+    Honours q-values: "gzip;q=0" refuses gzip, and a "*" entry covers gzip
+    when gzip itself is not listed.
+    """
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding != "gzip" and coding != "*":
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding == "gzip":
+            return quality > 0
+        wildcard = quality > 0
+    return wildcard
+
+
+class QValueGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that respects q-values (Starlette's only substring-matches "gzip")."""
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and _accepts_gzip(
+            Headers(scope=scope).get("accept-encoding", "")
+        ):
+            responder = GZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(QValueGZipMiddleware, minimum_size=500, compresslevel=6)
+
 # ================================================================================
 # SERVICE INITIALIZATION
 # ================================================================================
@@ -125,6 +220,93 @@ analytics_service = AnalyticsService(db)
 rbac_service = RBACService(db)
 escalation_service = EscalationService(db)
 
+# ================================================================================
+# PRE-SERIALIZED CONSTANT PAYLOADS
+# ================================================================================
+"""
+Some responses never change while the process is running (admin payloads,
+architecture document). They are serialized and gzip-compressed once here,
+so each request only picks the right bytes - or answers 304 to a matching
+If-None-Match - instead of re-encoding and re-compressing the same document.
+Only the bytes are kept, not the source dict.
+"""
+
+
+class PrecompressedJSON:
+    """
+    JSON document serialized once, kept as identity and gzip bytes.
+    
+    Each representation has its own strong ETag (the gzip body is a
+    different representation). If-None-Match uses weak comparison (RFC
+    9110 13.1.2), so a W/ prefix added by a proxy still revalidates.
+    cache_control, if given, is sent as-is.
+    """
+    
+    def __init__(self, payload, cache_control: str | None = None):
+        # Same encoding as the app's default ORJSONResponse
+        self.body = orjson.dumps(payload)
+        self.gzip_body = gzip.compress(self.body, compresslevel=9)
+        
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:16] + '"'
+        self.etag_gzip = self.etag[:-1] + '-gzip"'
+        self.headers = {"ETag": self.etag, "Vary": "Accept-Encoding"}
+        if cache_control:
+            self.headers["Cache-Control"] = cache_control
+        self.headers_gzip = {**self.headers, "ETag": self.etag_gzip}
+    
+    def response(self, request: Request) -> Response:
+        """Return 304 on a matching ETag, else gzip or plain JSON bytes."""
+        gzip_ok = _accepts_gzip(request.headers.get("accept-encoding", ""))
+        headers = self.headers_gzip if gzip_ok else self.headers
+        
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if "*" in tags or self.etag in tags or self.etag_gzip in tags:
+                return Response(status_code=304, headers=headers)
+        
+        if gzip_ok:
+            return Response(
+                self.gzip_body,
+                media_type="application/json",
+                headers={**headers, "Content-Encoding": "gzip"}
+            )
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+_LEGACY_SYSTEMS_DOC: Dict = {
+    "integration_type": "Enterprise Service Bus (ESB)",
+    "total_systems": len(get_all_legacy_systems()),
+    "systems": get_all_legacy_systems(),
+    "architecture_notes": {
+        "esb_platform": "Simulated (Production: MuleSoft/Azure Service Bus)",
+        "data_flow": "On-Premise → ESB → Cloud API → Client",
+        "compliance": {
+            "FERPA": "Academic records kept on-premise",
+            "PCI-DSS": "Financial data kept on-premise",
+            "GDPR": "PII data with proper access controls"
+        }
+    }
+}
+_LEGACY_SYSTEMS_PAYLOAD = PrecompressedJSON(_LEGACY_SYSTEMS_DOC)
+
+_ROLES_PAYLOAD = PrecompressedJSON({
+    "roles": [role.value for role in Role],
+    "permissions": [perm.value for perm in Permission],
+    "role_permissions": {
+        # Sorted: frozenset order is hash-seeded, and the body (and its
+        # ETag) must be identical across worker processes
+        Role.STUDENT.value: sorted(p.value for p in rbac_service.ROLE_PERMISSIONS[Role.STUDENT]),
+        Role.STAFF.value: sorted(p.value for p in rbac_service.ROLE_PERMISSIONS[Role.STAFF]),
+        Role.ADMIN.value: sorted(p.value for p in rbac_service.ROLE_PERMISSIONS[Role.ADMIN])
+    },
+    "description": {
+        "student": "Can view own profile, use chat, access knowledge base",
+        "staff": "Can view student data, analytics, manage escalations",
+        "admin": "Full system access including user management and system config"
+    }
+})
+
 # Mount static files for frontend
 static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 if os.path.exists(static_dir):
@@ -216,10 +398,13 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     
     SECURITY NOTES:
     - JWT secret should be in Azure Key Vault / AWS Secrets Manager
-    - Passwords hashed with bcrypt (already implemented)
+    - Passwords hashed with salted scrypt (bcrypt/Argon2 in production)
     - Token expiration: 30 minutes (configurable)
     """
-    user = auth_service.authenticate_user(form_data.username, form_data.password)
+    # scrypt verification is deliberately slow (~50 ms); keep it off the event loop
+    user = await run_in_threadpool(
+        auth_service.authenticate_user, form_data.username, form_data.password
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -235,9 +420,20 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
 # CHAT/QUERY ENDPOINTS - Core AI Functionality
 # ================================================================================
 
-@app.post("/api/chat", response_model=QueryResponse, tags=["AI Chat"])
+@app.post(
+    "/api/chat",
+    response_model=None,
+    responses={200: {"model": QueryResponse}},
+    tags=["AI Chat"],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": QueryRequest.model_json_schema()}}
+        }
+    }
+)
 async def chat(
-    query: QueryRequest,
+    request: Request,
     current_user: Dict = Depends(auth_service.get_current_user)
 ):
     """
@@ -274,10 +470,18 @@ async def chat(
     - Vector embeddings for semantic search
     - Real-time analytics pipeline (Azure Event Hubs)
     """
+    # Parse and validate the raw body in one pass (pydantic-core JSON parser)
+    try:
+        query = QUERY_REQUEST_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+    
     try:
         # Step 1: Get unified student data via ESB
         # ESB aggregates data from multiple on-premise systems
-        student_data = esb_service.get_unified_student_profile(query.student_id)
+        student_data = await esb_service.get_unified_student_profile(query.student_id)
         
         if not student_data:
             raise HTTPException(
@@ -297,17 +501,26 @@ async def chat(
             category=category
         )
         
-        # Step 4: Log for analytics (async in production)
+        # Step 4: Log for analytics (queued, written in the background)
         analytics_service.log_query(
             student_id=query.student_id,
             query=query.message,
             response=response
         )
         
-        return response
+        return Response(
+            content=QUERY_RESPONSE_ADAPTER.dump_json(response),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
+    except UNAVAILABLE_ERRORS as e:
+        # Admissions unreachable (open circuit / retries exhausted)
+        raise HTTPException(
+            status_code=503,
+            detail=f"Student records temporarily unavailable: {type(e).__name__}"
+        )
     except Exception as e:
         # PRODUCTION: Log to Azure Application Insights
         raise HTTPException(
@@ -320,7 +533,12 @@ async def chat(
 # STUDENT DATA ENDPOINTS - ESB Integration Demo
 # ================================================================================
 
-@app.get("/api/students/{student_id}", response_model=StudentModel, tags=["Student Data"])
+@app.get(
+    "/api/students/{student_id}",
+    response_model=None,
+    responses={200: {"model": StudentModel}},
+    tags=["Student Data"]
+)
 async def get_student_profile(
     student_id: str,
     current_user: Dict = Depends(auth_service.get_current_user)
@@ -362,7 +580,13 @@ async def get_student_profile(
     - Error handling & retry logic
     - Caching for performance
     """
-    student_data = esb_service.get_unified_student_profile(student_id)
+    try:
+        student_data = await esb_service.get_unified_student_profile(student_id)
+    except UNAVAILABLE_ERRORS as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Student records temporarily unavailable: {type(e).__name__}"
+        )
     
     if not student_data:
         raise HTTPException(
@@ -370,7 +594,9 @@ async def get_student_profile(
             detail=f"Student {student_id} not found"
         )
     
-    return student_data
+    # Project the ESB profile onto the StudentModel schema, validate the
+    # projection and encode with orjson
+    return Response(content=StudentModel.dump_esb_profile(student_data), media_type="application/json")
 
 
 @app.get("/api/esb/status", tags=["ESB Integration"])
@@ -397,7 +623,12 @@ async def get_esb_status(
 # ANALYTICS ENDPOINTS - Admin Dashboard
 # ================================================================================
 
-@app.get("/api/analytics", response_model=AnalyticsMetrics, tags=["Analytics"])
+@app.get(
+    "/api/analytics",
+    response_model=None,
+    responses={200: {"model": AnalyticsMetrics}},
+    tags=["Analytics"]
+)
 async def get_analytics(
     current_user: Dict = Depends(auth_service.get_current_user)
 ):
@@ -422,7 +653,10 @@ async def get_analytics(
     - Power BI for dashboards
     - Real-time streaming analytics
     """
-    return analytics_service.get_metrics()
+    return Response(
+        content=ANALYTICS_ADAPTER.dump_json(analytics_service.get_metrics()),
+        media_type="application/json"
+    )
 
 
 @app.get("/api/analytics/queries", tags=["Analytics"])
@@ -444,7 +678,9 @@ async def get_query_log(
     - 90-day retention policy
     - PII masking for compliance
     """
-    return analytics_service.get_query_log(limit)
+    # Log entries are plain JSON types: serialize directly with orjson,
+    # skipping FastAPI's recursive jsonable_encoder pass
+    return ORJSONResponse(analytics_service.get_query_log(limit))
 
 
 # ================================================================================
@@ -508,33 +744,31 @@ async def get_all_users(
             detail="Access denied: Admin role required"
         )
     
-    # Return users without sensitive data
-    users = []
-    for username, user_data in db.users.items():
-        users.append({
-            "username": username,
-            "name": user_data.get("name", "Unknown"),
-            "role": user_data.get("role", "student"),
-            "department": user_data.get("department"),
-            "student_id": user_data.get("student_id"),
-            "is_active": user_data.get("is_active", True),
-            "created_at": user_data.get("created_at"),
-            "last_login": user_data.get("last_login")
-        })
+    return _build_user_listing()
+
+
+def _build_user_listing() -> Dict:
+    """Build the admin user listing from the columnar user directory."""
+    # Return users without sensitive data (columnar directory, no passwords)
+    columns = db.user_directory
+    field_names = tuple(columns)
+    users = [dict(zip(field_names, row)) for row in zip(*columns.values())]
+    role_counts = Counter(columns["role"])
     
     return {
         "total_users": len(users),
         "users": users,
         "role_summary": {
-            "students": len([u for u in users if u["role"] == "student"]),
-            "staff": len([u for u in users if u["role"] == "staff"]),
-            "admins": len([u for u in users if u["role"] == "admin"])
+            "students": role_counts["student"],
+            "staff": role_counts["staff"],
+            "admins": role_counts["admin"]
         }
     }
 
 
 @app.get("/api/admin/legacy-systems", tags=["Admin"])
 async def get_legacy_systems_status(
+    request: Request,
     current_user: Dict = Depends(auth_service.get_current_user)
 ):
     """
@@ -577,27 +811,12 @@ async def get_legacy_systems_status(
             detail="Access denied: Staff or Admin role required"
         )
     
-    # Get all legacy systems info
-    legacy_systems = get_all_legacy_systems()
-    
-    return {
-        "integration_type": "Enterprise Service Bus (ESB)",
-        "total_systems": len(legacy_systems),
-        "systems": legacy_systems,
-        "architecture_notes": {
-            "esb_platform": "Simulated (Production: MuleSoft/Azure Service Bus)",
-            "data_flow": "On-Premise → ESB → Cloud API → Client",
-            "compliance": {
-                "FERPA": "Academic records kept on-premise",
-                "PCI-DSS": "Financial data kept on-premise",
-                "GDPR": "PII data with proper access controls"
-            }
-        }
-    }
+    return _LEGACY_SYSTEMS_PAYLOAD.response(request)
 
 
 @app.get("/api/admin/roles", tags=["Admin"])
 async def get_roles_and_permissions(
+    request: Request,
     current_user: Dict = Depends(auth_service.get_current_user)
 ):
     """
@@ -613,19 +832,39 @@ async def get_roles_and_permissions(
             detail="Access denied: Admin role required"
         )
     
+    return _ROLES_PAYLOAD.response(request)
+
+
+@app.get("/api/admin/dashboard", tags=["Admin"])
+async def get_admin_dashboard(
+    current_user: Dict = Depends(auth_service.get_current_user)
+):
+    """
+    Get everything the admin dashboard shows in one call (Admin only).
+    
+    RBAC: Requires ADMIN role (checked once for all sections)
+    
+    Combines the payloads of:
+    - /api/admin/users          → "users"
+    - /api/analytics            → "analytics"
+    - /api/escalation/stats     → "escalation"
+    - /api/admin/legacy-systems → "legacy_systems"
+    
+    One round trip and one auth/RBAC evaluation per dashboard refresh
+    instead of four. The individual endpoints remain available.
+    """
+    if not rbac_service.has_permission(current_user["username"], Permission.MANAGE_USERS):
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied: Admin role required"
+        )
+    
     return {
-        "roles": [role.value for role in Role],
-        "permissions": [perm.value for perm in Permission],
-        "role_permissions": {
-            Role.STUDENT.value: [p.value for p in rbac_service.ROLE_PERMISSIONS[Role.STUDENT]],
-            Role.STAFF.value: [p.value for p in rbac_service.ROLE_PERMISSIONS[Role.STAFF]],
-            Role.ADMIN.value: [p.value for p in rbac_service.ROLE_PERMISSIONS[Role.ADMIN]]
-        },
-        "description": {
-            "student": "Can view own profile, use chat, access knowledge base",
-            "staff": "Can view student data, analytics, manage escalations",
-            "admin": "Full system access including user management and system config"
-        }
+        "users": _build_user_listing(),
+        "analytics": analytics_service.get_metrics(),
+        "escalation": escalation_service.get_escalation_stats(),
+        "legacy_systems": _LEGACY_SYSTEMS_DOC,
+        "generated_at": datetime.now().isoformat()
     }
 
 
@@ -700,6 +939,32 @@ async def list_students(
     }
 
 
+@app.get("/api/students/profiles/export", tags=["Student Data"])
+async def export_student_profiles(
+    current_user: Dict = Depends(auth_service.get_current_user)
+):
+    """
+    Export unified profiles of all students as NDJSON (Staff/Admin only).
+    
+    RBAC: Requires VIEW_ALL_STUDENTS permission
+    
+    One ESB unified profile per line, streamed as each batch of students
+    is aggregated, so the export is never held in memory as a whole and
+    does not fill the ESB profile cache.
+    """
+    if not rbac_service.has_permission(current_user["username"], Permission.VIEW_ALL_STUDENTS):
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied: Staff or Admin role required to export students"
+        )
+    
+    async def stream():
+        async for profile in esb_service.iter_unified_student_profiles(list(db.students)):
+            yield orjson.dumps(profile) + b"\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 # ================================================================================
 # SUPPORT STAFF PORTAL - Escalation & Ticketing
 # ================================================================================
@@ -726,22 +991,23 @@ async def get_tickets(
     # Students can only see their own tickets
     if user_role == Role.STUDENT:
         student_id = current_user.get("student_id")
-        if student_id:
-            return {
-                "tickets": escalation_service.get_student_tickets(student_id),
-                "can_manage": False
-            }
-        return {"tickets": [], "can_manage": False}
+        tickets = escalation_service.get_student_tickets(student_id) if student_id else []
+        return Response(
+            content=b'{"tickets":' + escalation_service.tickets_json(tickets)
+            + b',"can_manage":false}',
+            media_type="application/json"
+        )
     
     # Staff/Admin can see all tickets
+    # Ticket JSON is reused from the per-ticket cache, only stats are encoded
     tickets = escalation_service.get_all_tickets(status)
     stats = escalation_service.get_escalation_stats()
     
-    return {
-        "tickets": tickets,
-        "stats": stats,
-        "can_manage": True
-    }
+    return Response(
+        content=b'{"tickets":' + escalation_service.tickets_json(tickets)
+        + b',"stats":' + orjson.dumps(stats) + b',"can_manage":true}',
+        media_type="application/json"
+    )
 
 
 @app.get("/api/tickets/my", tags=["Support Tickets"])
@@ -758,9 +1024,14 @@ async def get_my_tickets(
     
     if user_role == Role.STUDENT:
         student_id = current_user.get("student_id")
-        return {"tickets": escalation_service.get_student_tickets(student_id) if student_id else []}
+        tickets = escalation_service.get_student_tickets(student_id) if student_id else []
+    else:
+        tickets = escalation_service.get_staff_tickets(current_user["username"])
     
-    return {"tickets": escalation_service.get_staff_tickets(current_user["username"])}
+    return Response(
+        content=b'{"tickets":' + escalation_service.tickets_json(tickets) + b"}",
+        media_type="application/json"
+    )
 
 
 @app.post("/api/tickets/create", tags=["Support Tickets"])
@@ -838,7 +1109,8 @@ async def assign_ticket(
     """
     Assign a ticket to yourself (Staff/Admin only).
     
-    Staff members can claim open tickets to work on them.
+    Staff members can claim open (unrouted) tickets or take over tickets
+    auto-assigned to a colleague.
     """
     user_role = rbac_service.get_user_role(current_user["username"])
     
@@ -942,26 +1214,23 @@ async def get_escalation_stats(
 # ARCHITECTURE DOCUMENTATION ENDPOINT
 # ================================================================================
 
-@app.get("/api/architecture", tags=["Documentation"])
-async def get_architecture_docs():
-    """
-    Get system architecture documentation.
-    
-    This endpoint explains how the MVP simulates enterprise legacy systems
-    and the overall hybrid cloud architecture.
-    
-    NO AUTHENTICATION REQUIRED - This is public documentation.
-    """
-    return {
-        "title": "TechEdu University - System Architecture",
-        "version": "1.0.0-MVP",
-        "overview": {
-            "description": "AI-Powered Intelligent Student Support System demonstrating enterprise integration patterns",
-            "methodology": "DBIM (Digital Business Innovation Methodology)",
-            "purpose": "Hackathon MVP demonstrating how AI can integrate with legacy university systems"
-        },
-        "data_architecture": {
-            "explanation": """
+"""
+The architecture document is fully static, so it is built and serialized
+once at import time. Requests return the cached bytes directly, skipping
+dict construction, jsonable_encoder and JSON encoding on every call.
+Only the bytes stay resident; the dict is dropped after serialization.
+"""
+
+_ARCH_DOC: Dict = {
+    "title": "TechEdu University - System Architecture",
+    "version": "1.0.0-MVP",
+    "overview": {
+        "description": "AI-Powered Intelligent Student Support System demonstrating enterprise integration patterns",
+        "methodology": "DBIM (Digital Business Innovation Methodology)",
+        "purpose": "Hackathon MVP demonstrating how AI can integrate with legacy university systems"
+    },
+    "data_architecture": {
+        "explanation": """
             This MVP uses IN-MEMORY data structures to SIMULATE what would be separate 
             on-premise legacy systems in a real university deployment.
             
@@ -977,59 +1246,59 @@ async def get_architecture_docs():
             - Redis for caching layer
             - Elasticsearch for search
             """,
-            "simulated_systems": [
-                {
-                    "name": "Admissions System",
-                    "real_world": "Ellucian Banner",
-                    "data_simulated": ["Student demographics", "Enrollment status", "Application data"],
-                    "why_on_premise": "Contains sensitive PII, institutional data governance"
-                },
-                {
-                    "name": "Academic Records",
-                    "real_world": "PeopleSoft Campus Solutions",
-                    "data_simulated": ["Courses", "Grades", "GPA", "Transcripts"],
-                    "why_on_premise": "FERPA compliance requires strict data residency"
-                },
-                {
-                    "name": "Financial Aid",
-                    "real_world": "PowerFAIDS / Banner Financial Aid",
-                    "data_simulated": ["Aid packages", "Disbursements", "FAFSA status"],
-                    "why_on_premise": "PCI-DSS compliance, sensitive financial data"
-                },
-                {
-                    "name": "Housing System",
-                    "real_world": "StarRez",
-                    "data_simulated": ["Room assignments", "Building info", "Move-in dates"],
-                    "why_on_premise": "Integrated with physical access control systems"
-                },
-                {
-                    "name": "Directory Services",
-                    "real_world": "Active Directory / LDAP",
-                    "data_simulated": ["User authentication", "Role assignments", "Group memberships"],
-                    "why_on_premise": "Core identity infrastructure, security requirements"
-                },
-                {
-                    "name": "Library System",
-                    "real_world": "Ex Libris Alma",
-                    "data_simulated": ["Checkouts", "Fines", "Research access"],
-                    "why_on_premise": "Licensing agreements, patron privacy"
-                }
-            ]
-        },
-        "esb_pattern": {
-            "what_is_esb": """
+        "simulated_systems": [
+            {
+                "name": "Admissions System",
+                "real_world": "Ellucian Banner",
+                "data_simulated": ["Student demographics", "Enrollment status", "Application data"],
+                "why_on_premise": "Contains sensitive PII, institutional data governance"
+            },
+            {
+                "name": "Academic Records",
+                "real_world": "PeopleSoft Campus Solutions",
+                "data_simulated": ["Courses", "Grades", "GPA", "Transcripts"],
+                "why_on_premise": "FERPA compliance requires strict data residency"
+            },
+            {
+                "name": "Financial Aid",
+                "real_world": "PowerFAIDS / Banner Financial Aid",
+                "data_simulated": ["Aid packages", "Disbursements", "FAFSA status"],
+                "why_on_premise": "PCI-DSS compliance, sensitive financial data"
+            },
+            {
+                "name": "Housing System",
+                "real_world": "StarRez",
+                "data_simulated": ["Room assignments", "Building info", "Move-in dates"],
+                "why_on_premise": "Integrated with physical access control systems"
+            },
+            {
+                "name": "Directory Services",
+                "real_world": "Active Directory / LDAP",
+                "data_simulated": ["User authentication", "Role assignments", "Group memberships"],
+                "why_on_premise": "Core identity infrastructure, security requirements"
+            },
+            {
+                "name": "Library System",
+                "real_world": "Ex Libris Alma",
+                "data_simulated": ["Checkouts", "Fines", "Research access"],
+                "why_on_premise": "Licensing agreements, patron privacy"
+            }
+        ]
+    },
+    "esb_pattern": {
+        "what_is_esb": """
             Enterprise Service Bus (ESB) is a middleware architecture that allows 
             different systems to communicate through a central hub rather than 
             point-to-point integrations.
             """,
-            "why_esb": [
-                "Decouples systems - changes to one don't break others",
-                "Protocol translation - SOAP, REST, file-based all work together",
-                "Data transformation - XML to JSON, different schemas",
-                "Security - centralized authentication and authorization",
-                "Monitoring - single place to see all integrations"
-            ],
-            "mvp_simulation": """
+        "why_esb": [
+            "Decouples systems - changes to one don't break others",
+            "Protocol translation - SOAP, REST, file-based all work together",
+            "Data transformation - XML to JSON, different schemas",
+            "Security - centralized authentication and authorization",
+            "Monitoring - single place to see all integrations"
+        ],
+        "mvp_simulation": """
             Our ESBService class SIMULATES what MuleSoft, Azure Service Bus, 
             or IBM Integration Bus would do:
             - Aggregates data from multiple 'systems' (our mock databases)
@@ -1037,13 +1306,13 @@ async def get_architecture_docs():
             - Handles errors gracefully
             - Provides integration status monitoring
             """,
-            "production_implementation": {
-                "options": ["MuleSoft Anypoint", "Azure Service Bus", "AWS EventBridge", "Apache Camel"],
-                "features": ["Message queuing", "Event-driven architecture", "Circuit breakers", "Retry policies"]
-            }
-        },
-        "hybrid_cloud_architecture": {
-            "diagram": """
+        "production_implementation": {
+            "options": ["MuleSoft Anypoint", "Azure Service Bus", "AWS EventBridge", "Apache Camel"],
+            "features": ["Message queuing", "Event-driven architecture", "Circuit breakers", "Retry policies"]
+        }
+    },
+    "hybrid_cloud_architecture": {
+        "diagram": """
             ┌─────────────────────────────────────────────────────────────────┐
             │                         CLOUD (Azure/AWS)                        │
             │  ┌──────────┐  ┌──────────┐  ┌──────────┐  ┌──────────┐        │
@@ -1070,28 +1339,28 @@ async def get_architecture_docs():
             │  └───────────┘  └──────────────┘  └───────────┘  └──────────┘ │
             └─────────────────────────────────────────────────────────────────┘
             """,
-            "cloud_components": {
-                "what_goes_in_cloud": [
-                    "API Gateway - handles all external traffic",
-                    "AI/ML Processing - GPT-4, intent classification",
-                    "Analytics Dashboard - aggregated, anonymized metrics",
-                    "Frontend Application - React/Vue hosted on CDN",
-                    "Caching Layer - Redis for performance"
-                ],
-                "benefits": ["Scalability", "Global availability", "Managed services", "Cost efficiency"]
-            },
-            "on_premise_components": {
-                "what_stays_on_premise": [
-                    "Student Information System - core institutional data",
-                    "Financial Systems - compliance requirements",
-                    "Academic Records - FERPA data residency",
-                    "Identity Services - security infrastructure"
-                ],
-                "reasons": ["Compliance (FERPA, PCI-DSS)", "Data sovereignty", "Existing investments", "Security policies"]
-            }
+        "cloud_components": {
+            "what_goes_in_cloud": [
+                "API Gateway - handles all external traffic",
+                "AI/ML Processing - GPT-4, intent classification",
+                "Analytics Dashboard - aggregated, anonymized metrics",
+                "Frontend Application - React/Vue hosted on CDN",
+                "Caching Layer - Redis for performance"
+            ],
+            "benefits": ["Scalability", "Global availability", "Managed services", "Cost efficiency"]
         },
-        "ai_architecture": {
-            "mvp_approach": """
+        "on_premise_components": {
+            "what_stays_on_premise": [
+                "Student Information System - core institutional data",
+                "Financial Systems - compliance requirements",
+                "Academic Records - FERPA data residency",
+                "Identity Services - security infrastructure"
+            ],
+            "reasons": ["Compliance (FERPA, PCI-DSS)", "Data sovereignty", "Existing investments", "Security policies"]
+        }
+    },
+    "ai_architecture": {
+        "mvp_approach": """
             For this MVP, we use RULE-BASED AI:
             - Keyword matching for intent classification
             - Template-based responses with personalization
@@ -1099,38 +1368,59 @@ async def get_architecture_docs():
             
             This demonstrates the CONCEPT without API costs or complexity.
             """,
-            "production_approach": {
-                "components": [
-                    "GPT-4 / Azure OpenAI for natural language understanding",
-                    "Vector embeddings for semantic search (Pinecone/Weaviate)",
-                    "RAG (Retrieval Augmented Generation) for accurate responses",
-                    "Fine-tuned models for university-specific terminology"
-                ],
-                "why_not_in_mvp": "API costs, setup complexity, demo reliability"
-            }
-        },
-        "security_model": {
-            "authentication": "JWT tokens with role-based claims",
-            "authorization": "RBAC with Student/Staff/Admin roles",
-            "production_additions": [
-                "Azure AD / SAML SSO integration",
-                "Multi-factor authentication",
-                "OAuth 2.0 with refresh tokens",
-                "API rate limiting",
-                "Audit logging"
-            ]
+        "production_approach": {
+            "components": [
+                "GPT-4 / Azure OpenAI for natural language understanding",
+                "Vector embeddings for semantic search (Pinecone/Weaviate)",
+                "RAG (Retrieval Augmented Generation) for accurate responses",
+                "Fine-tuned models for university-specific terminology"
+            ],
+            "why_not_in_mvp": "API costs, setup complexity, demo reliability"
         }
+    },
+    "security_model": {
+        "authentication": "JWT tokens with role-based claims",
+        "authorization": "RBAC with Student/Staff/Admin roles",
+        "production_additions": [
+            "Azure AD / SAML SSO integration",
+            "Multi-factor authentication",
+            "OAuth 2.0 with refresh tokens",
+            "API rate limiting",
+            "Audit logging"
+        ]
     }
+}
+
+_ARCH_PAYLOAD = PrecompressedJSON(
+    _ARCH_DOC, cache_control="public, max-age=3600, immutable"
+)
+
+# Only the serialized forms are served; release the source dict tree.
+del _ARCH_DOC
+
+
+@app.get("/api/architecture", tags=["Documentation"], response_model=None)
+async def get_architecture_docs(request: Request):
+    """
+    Get system architecture documentation.
+    
+    This endpoint explains how the MVP simulates enterprise legacy systems
+    and the overall hybrid cloud architecture.
+    
+    NO AUTHENTICATION REQUIRED - This is public documentation.
+    
+    CACHING: Responds with an ETag; clients revalidating with a matching
+    If-None-Match header get 304 Not Modified and no body. The gzip body
+    is compressed once at import time, not per request.
+    """
+    return _ARCH_PAYLOAD.response(request)
 
 
 # ================================================================================
 # APPLICATION ENTRY POINT
 # ================================================================================
 
-if __name__ == "__main__":
-    import uvicorn
-    
-    print("""
+_BANNER_BYTES: bytes = """
     ╔════════════════════════════════════════════════════════════════════════╗
     ║           TechEdu University - Student Support Portal             ║
     ║                     DBIM MVP Implementation                            ║
@@ -1156,11 +1446,23 @@ if __name__ == "__main__":
     ║    • Rule-based AI (Ready for GPT-4)                                   ║
     ║    • In-memory Data (Ready for PostgreSQL/Snowflake)                   ║
     ╚════════════════════════════════════════════════════════════════════════╝
-    """)
+""".encode("utf-8")
+
+# Auto-reload re-imports the whole app on every change: development only
+_RELOAD = os.getenv("UVICORN_RELOAD", "true").lower() in ("1", "true", "yes")
+
+
+if __name__ == "__main__":
+    import sys
+    import uvicorn
+    
+    sys.stdout.buffer.write(_BANNER_BYTES)
+    sys.stdout.buffer.flush()
     
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=_RELOAD,
+        access_log=_RELOAD  # PRODUCTION: access logs come from the load balancer
     )
@@ -18,10 +18,12 @@ PRODUCTION:
 ================================================================================
 """
 
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional, Dict, Any
+import orjson
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter
+from typing import Any, Literal, get_args, get_origin
+from typing_extensions import Annotated, TypedDict
+import re
 from datetime import datetime
-from enum import Enum
 
 
 # ================================================================================
@@ -36,7 +38,7 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     """Data extracted from JWT token."""
-    username: Optional[str] = None
+    username: str | None = None
 
 
 # ================================================================================
@@ -51,14 +53,36 @@ In production, data comes from multiple ON-PREMISE systems:
 - Housing: StarRez
 
 ESB transforms and aggregates data into this unified format.
+
+Fields a legacy system may not supply (year, GPA, disbursement date, an
+unassigned room) are optional: the ESB fills them with None when that
+system has no record or did not respond.
+
+PERFORMANCE: StudentModel.dump_esb_profile() projects the ESB profile onto
+this schema with a field plan derived from model_fields, validates the
+small projection and encodes it with orjson, instead of validating the
+full profile and serializing through the model.
 """
 
+# Emails come from Directory Services (LDAP/AD), so a syntax check is enough
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _check_email(value: str) -> str:
+    """Reject strings that are not shaped like user@domain.tld."""
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+DirectoryEmail = Annotated[str, AfterValidator(_check_email)]
+
 class CourseModel(BaseModel):
     """Individual course enrollment."""
     code: str
     name: str
     credits: int
-    grade: Optional[str] = None
+    grade: str | None = None
 
 
 class FinancialAidModel(BaseModel):
@@ -71,14 +95,50 @@ class FinancialAidModel(BaseModel):
     """
     status: str
     amount: float
-    disbursement_date: str
+    disbursement_date: str | None = None
 
 
 class HousingModel(BaseModel):
     """Student housing assignment."""
-    building: str
-    room: str
-    move_in_date: str
+    building: str | None = None
+    room: str | None = None
+    move_in_date: str | None = None
+
+
+def _projection_plan(model: type[BaseModel]) -> tuple:
+    """
+    Walk model_fields once into (name, is_float, nested_plan, is_list)
+    entries; nested models and lists of models recurse.
+    """
+    plan = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        is_list = get_origin(annotation) is list
+        target = get_args(annotation)[0] if is_list else annotation
+        nested = None
+        if isinstance(target, type) and issubclass(target, BaseModel):
+            nested = _projection_plan(target)
+        is_float = float in (annotation, *get_args(annotation))
+        plan.append((name, is_float, nested, is_list))
+    return tuple(plan)
+
+
+def _project(data: dict[str, Any] | None, plan: tuple) -> dict[str, Any] | None:
+    """Keep only the plan's fields; whole-number floats become float."""
+    if data is None:
+        return None
+    projection = {}
+    for name, is_float, nested, is_list in plan:
+        value = data.get(name)
+        if nested is not None:
+            if is_list:
+                value = None if value is None else [_project(item, nested) for item in value]
+            else:
+                value = _project(value, nested)
+        elif is_float and type(value) is int:
+            value = float(value)  # Legacy systems report whole dollars
+        projection[name] = value
+    return projection
 
 
 class StudentModel(BaseModel):
@@ -100,30 +160,48 @@ class StudentModel(BaseModel):
     """
     id: str
     name: str
-    email: EmailStr
+    email: DirectoryEmail
     program: str
-    year: int
-    gpa: float
+    year: int | None = None
+    gpa: float | None = None
     financial_aid: FinancialAidModel
-    courses: List[CourseModel]
+    courses: list[CourseModel]
     housing: HousingModel
+    
+    @staticmethod
+    def dump_esb_profile(data: dict[str, Any]) -> bytes:
+        """
+        Serialize an ESB unified profile to StudentModel JSON.
+        
+        Projects the profile onto the StudentModel fields (extra keys are
+        dropped), validates the projection against the schema and encodes
+        it with orjson.
+        
+        Raises:
+            pydantic.ValidationError: the profile does not fit the schema
+        """
+        projection = _project(data, _STUDENT_PLAN)
+        StudentModel.__pydantic_validator__.validate_python(projection)
+        return orjson.dumps(projection)
+
+
+# Field plan for dump_esb_profile(), derived once from the model definitions
+_STUDENT_PLAN = _projection_plan(StudentModel)
 
 
 # ================================================================================
 # CHAT/QUERY MODELS
 # ================================================================================
 
-class MessageRole(str, Enum):
-    """Chat message role identifier."""
-    USER = "user"
-    ASSISTANT = "assistant"
+# Chat message role identifier (Literal: plain-string validation, no Enum lookup)
+MessageRole = Literal["user", "assistant"]
 
 
 class ChatMessage(BaseModel):
     """Individual chat message."""
     role: MessageRole
     content: str
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
 
 
 class QueryRequest(BaseModel):
@@ -142,7 +220,9 @@ class QueryRequest(BaseModel):
     """
     student_id: str
     message: str
-    history: Optional[List[Dict[str, str]]] = None
+    # Opaque to the backend (forwarded as-is to the LLM in production), so it
+    # is not validated item by item.
+    history: Any = None
 
 
 class QueryResponse(BaseModel):
@@ -166,13 +246,54 @@ class QueryResponse(BaseModel):
     category: str
     confidence: float
     automated: bool
-    timestamp: datetime = datetime.now()
-    sources: List[str] = []
+    timestamp: datetime = Field(default_factory=datetime.now)  # Set per instance
+    sources: list[str] = Field(default_factory=list)
 
 
 # ================================================================================
 # ANALYTICS MODELS
 # ================================================================================
+"""
+Nested analytics sections are TypedDicts rather than BaseModels: they are
+validated as plain dicts (no per-section model instance) and serialize
+straight through the orjson dict path.
+NOTE: typing_extensions.TypedDict is required by pydantic on Python < 3.12.
+"""
+
+class TopCategory(TypedDict):
+    """One entry in the top query categories list."""
+    name: str
+    count: int
+    percentage: int
+
+
+class SystemHealth(TypedDict):
+    """System health indicators (display strings)."""
+    api_status: str
+    api_response_time: str
+    database_status: str
+    database_query_time: str
+    ai_service_status: str
+    esb_status: str
+    cache_hit_rate: str
+    uptime: str
+    last_incident: str
+
+
+class ROIMetrics(TypedDict):
+    """AI investment ROI figures (currency values pre-formatted)."""
+    cost_per_query_human: str
+    cost_per_query_ai: str
+    automated_queries: int
+    workload_reduction_percent: int
+    cost_savings_to_date: str
+    monthly_savings_projected: str
+    annual_savings_projected: str
+    implementation_cost: str
+    roi_year1_percent: float
+    break_even_months: int | str  # "N/A" when no savings yet
+    notes: str
+
 
 class AnalyticsMetrics(BaseModel):
     """
@@ -195,21 +316,31 @@ class AnalyticsMetrics(BaseModel):
     satisfaction_score: float  # Percentage
     active_users: int
     queries_last_24h: int
-    top_categories: List[Dict[str, Any]]
-    system_health: Dict[str, Any]
-    roi_metrics: Dict[str, Any]
+    top_categories: list[TopCategory]
+    system_health: SystemHealth
+    roi_metrics: ROIMetrics
 
 
 # ================================================================================
 # ESB INTEGRATION MODELS
 # ================================================================================
 
+SystemHealthState = Literal["operational", "degraded", "offline"]
+SystemLocation = Literal["cloud", "on-premise"]
+
+
 class SystemStatus(BaseModel):
-    """Status of an integrated legacy system."""
+    """
+    Status of an integrated legacy system.
+    
+    NOTE: status/location are closed sets, so they are Literals. If
+    status-specific payloads are ever added, model them as separate classes
+    in an Annotated[Union[...], Field(discriminator="status")] tagged union.
+    """
     name: str
-    status: str  # operational, degraded, offline
-    location: str  # cloud, on-premise
-    last_sync: Optional[datetime] = None
+    status: SystemHealthState
+    location: SystemLocation
+    last_sync: datetime | None = None
 
 
 class ESBStatus(BaseModel):
@@ -222,5 +353,19 @@ class ESBStatus(BaseModel):
     - Integration patterns
     """
     esb_status: str
-    connected_systems: List[Dict[str, Any]]
-    message_flow: Dict[str, Any]
+    connected_systems: list[dict[str, Any]]
+    message_flow: dict[str, Any]
+
+
+# ================================================================================
+# PRECOMPILED ADAPTERS
+# ================================================================================
+"""
+Validators/serializers built once at import time for the hot endpoints.
+Handlers use these to validate raw JSON bodies and to emit response bytes
+directly, instead of FastAPI's per-response dump → validate → encode path.
+"""
+
+QUERY_REQUEST_ADAPTER = TypeAdapter(QueryRequest)
+QUERY_RESPONSE_ADAPTER = TypeAdapter(QueryResponse)
+ANALYTICS_ADAPTER = TypeAdapter(AnalyticsMetrics)
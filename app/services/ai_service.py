@@ -55,10 +55,177 @@ COST OPTIMIZATION:
 """
 
 import random
-from datetime import datetime
-from typing import Dict, List, Optional
+import string
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from app.models.schemas import QueryResponse
 
+# Shared parser for response templates (see AIService._compile_template)
+_FORMATTER = string.Formatter()
+
+
+class _LazyStudentFields(dict):
+    """
+    Template values for one student, computed only when a template asks.
+    
+    Most templates reference a handful of the ~35 available fields, so
+    each value (and its currency formatting) is produced on first lookup
+    by the matching entry in _TEMPLATE_FIELDS and memoized in the dict.
+    """
+    
+    def __init__(self, student_data: Dict):
+        super().__init__()
+        # Extract nested data safely (now from legacy systems)
+        self.student = student_data
+        self.financial_aid = student_data.get("financial_aid", {})
+        self.housing = student_data.get("housing", {})
+        self.library = student_data.get("library", {})
+        self.meal_plan = self.housing.get("meal_plan", {})
+    
+    def __missing__(self, key: str):
+        getter = _TEMPLATE_FIELDS.get(key)
+        if getter is None:
+            raise KeyError(key)
+        value = self[key] = getter(self)
+        return value
+
+
+def _first_word(name: str) -> str:
+    """First space-separated word of a name, without building a split list."""
+    space = name.find(" ")
+    return name if space < 0 else name[:space]
+
+
+def _first_name(student: Dict) -> str:
+    """Profile first_name, else the first word of the full name."""
+    first_name = student.get("first_name")
+    if first_name is None:
+        first_name = _first_word(student.get("name", "Student"))
+    return first_name
+
+
+_AID_TOTAL_FIELDS = (
+    ("grants", "grants_total"),
+    ("scholarships", "scholarships_total"),
+    ("loans", "loans_total"),
+)
+
+
+def _aid_totals(fields: _LazyStudentFields) -> _LazyStudentFields:
+    """
+    Fill all three aid-bucket totals in one pass on first use.
+    
+    Templates that show one total usually show the others, so they are
+    summed together; templates without aid totals never pay for them.
+    """
+    financial_aid = fields.financial_aid
+    for bucket, field in _AID_TOTAL_FIELDS:
+        total = 0
+        for entry in financial_aid.get(bucket, ()):
+            total += entry.get("amount", 0)
+        fields[field] = f"${total:,}"
+    return fields
+
+
+# Field name → value getter. Currency values are pre-formatted strings.
+_TEMPLATE_FIELDS = {
+    # Basic info
+    "name": lambda f: f.student.get("name", "Student"),
+    "first_name": lambda f: _first_name(f.student),
+    "program": lambda f: f.student.get("program", "N/A"),
+    "year": lambda f: f.student.get("year", "N/A"),
+    
+    # Academic data (from PeopleSoft)
+    "gpa": lambda f: f.student.get("gpa", "N/A"),
+    "gpa_semester": lambda f: f.student.get("gpa_semester", "N/A"),
+    "credits_completed": lambda f: f.student.get("credits_completed", 0),
+    "credits_in_progress": lambda f: f.student.get("credits_in_progress", 0),
+    "academic_standing": lambda f: f.student.get("academic_standing", "N/A"),
+    "dean_list": lambda f: "Yes ⭐" if f.student.get("dean_list") else "No",
+    "courseCount": lambda f: len(f.student.get("courses", [])),
+    "semester": lambda f: f.student.get("semester", "N/A"),
+    
+    # Financial aid (from PowerFAIDS) - detailed
+    "amount": lambda f: f"${f.financial_aid.get('total_aid', f.financial_aid.get('amount', 0)):,}",
+    "total_aid": lambda f: f"${f.financial_aid.get('total_aid', 0):,}",
+    "remaining_balance": lambda f: f"${f.financial_aid.get('remaining_balance', 0):,}",
+    "date": lambda f: f.financial_aid.get("next_disbursement", f.financial_aid.get("disbursement_date", "N/A")),
+    "next_disbursement": lambda f: f.financial_aid.get("next_disbursement", "N/A"),
+    "grants_total": lambda f: _aid_totals(f)["grants_total"],
+    "scholarships_total": lambda f: _aid_totals(f)["scholarships_total"],
+    "loans_total": lambda f: _aid_totals(f)["loans_total"],
+    "aid_status": lambda f: f.financial_aid.get("status", "N/A"),
+    "cost_of_attendance": lambda f: f"${f.financial_aid.get('total_cost_of_attendance', 0):,}",
+    "financial_need": lambda f: f"${f.financial_aid.get('financial_need', 0):,}",
+    
+    # Housing (from StarRez) - detailed
+    "building": lambda f: f.housing.get("building", "N/A"),
+    "room": lambda f: f.housing.get("room", "N/A"),
+    "room_type": lambda f: f.housing.get("room_type", "N/A"),
+    "floor": lambda f: f.housing.get("floor", "N/A"),
+    "meal_plan": lambda f: f.meal_plan.get("name", "None"),
+    "meals_per_week": lambda f: f.meal_plan.get("meals_per_week", 0),
+    "flex_remaining": lambda f: f"${f.meal_plan.get('flex_remaining', 0)}",
+    "move_in_date": lambda f: f.housing.get("move_in_date", "N/A"),
+    "move_out_date": lambda f: f.housing.get("move_out_date", "N/A"),
+    
+    # Library (from Ex Libris)
+    "library_items": lambda f: f.library.get("items_checked_out", 0),
+    "library_fines": lambda f: f"${f.library.get('fines_owed', 0):.2f}",
+    "library_overdue": lambda f: f.library.get("items_overdue", 0),
+}
+
+
+# =============================================================================
+# STATIC RESPONSE TEXT
+# Built once at import; escalation and fallback replies reuse these objects
+# =============================================================================
+
+_ESCALATION_TEXT = (
+    "I understand this is an important matter that needs personal attention. "
+    "I've detected that your query may require human assistance.\n\n"
+    "**I can:**\n"
+    "• 🎫 Create a support ticket so our staff can help you personally\n"
+    "• 📞 Provide contact info: (555) 123-4567\n"
+    "• 📧 Email: support@techedu.edu\n\n"
+    "Click 'Talk to Support' below to create a ticket and connect with a staff member. "
+    "Average response time: 4-24 hours."
+)
+_ESCALATION_SOURCES = ("support.techedu.edu",)
+
+# Follows the "Hi {first name}! " greeting
+_FALLBACK_TEXT = (
+    "I'm not quite sure I understood your question correctly. "
+    "Here are some things I can help you with:\n\n"
+    "• 💰 **Financial Aid** - Scholarships, payments, FAFSA\n"
+    "• 📚 **Registration** - Courses, enrollment, schedules\n"
+    "• 📊 **Grades & GPA** - Transcripts, academic records\n"
+    "• 🏠 **Housing** - Dorms, room assignments, maintenance\n"
+    "• 🎓 **Admissions** - Applications, requirements\n"
+    "• 💼 **Career Services** - Jobs, internships, resume help\n\n"
+    "Could you rephrase your question? Or if you need human assistance, click 'Talk to Support' below."
+)
+_FALLBACK_SOURCES = ("help.techedu.edu",)
+
+
+class _KBItem(NamedTuple):
+    """
+    Read-only snapshot of one knowledge base entry for the hot paths.
+    
+    The database keeps plain dicts (served as-is by the admin API); the
+    service works from these tuples with attribute access instead.
+    """
+    category: str
+    keywords: Tuple[str, ...]
+    responses: Tuple[str, ...]
+
+
+class _SearchHit(NamedTuple):
+    """One cached knowledge base search result, immutable."""
+    category: str
+    matched_keywords: Tuple[str, ...]
+    sample_response: Optional[str]
+
 
 class AIService:
     """
@@ -84,15 +251,20 @@ class AIService:
     └─────────────────────────────────────────────────────────────────┘
     """
     
-    def __init__(self, db):
+    def __init__(self, db, seed: Optional[int] = None):
         """
         Initialize AI service with database reference.
         
         Args:
             db: MockDatabase instance containing knowledge base
+            seed: Optional seed for template choice and confidence jitter,
+                for reproducible demos (default: OS entropy)
         """
         self.db = db
         
+        # Service-owned generator: no shared global random state
+        self._rng = random.Random(seed)
+        
         # Confidence thresholds
         self.HIGH_CONFIDENCE = 0.85
         self.LOW_CONFIDENCE = 0.45
@@ -103,6 +275,84 @@ class AIService:
             "speak to human", "real person", "manager", "sue", "lawyer",
             "discrimination", "harassment", "unfair"
         ]
+        
+        self._compile_intent_matcher()
+        self._index_knowledge_base()
+        
+        # Bounded LRU cache for knowledge base searches.
+        # Key: (normalized query, limit) → immutable _SearchHit tuples;
+        # callers get freshly built result dicts, never the cached entry
+        # PRODUCTION: Shared Redis cache with TTL, invalidated on CMS publish
+        self.SEARCH_CACHE_SIZE = 2048
+        self._search_cache: "OrderedDict[tuple, Tuple[_SearchHit, ...]]" = OrderedDict()
+    
+    def reload_knowledge_base(self):
+        """
+        Rebuild derived structures after the knowledge base changes.
+        
+        Recompiles the intent matcher, re-indexes entries by category and
+        drops cached search results.
+        """
+        self._compile_intent_matcher()
+        self._index_knowledge_base()
+        self._search_cache.clear()
+    
+    def _index_knowledge_base(self):
+        """
+        Snapshot knowledge base entries as _KBItem tuples, index them by
+        category (first entry wins) and precompile every response template.
+        """
+        self._kb_items: List[_KBItem] = [
+            _KBItem(entry["category"], tuple(entry["keywords"]), tuple(entry["responses"]))
+            for entry in self.db.knowledge_base
+        ]
+        self._kb_by_category: Dict[str, _KBItem] = {}
+        self._compiled_templates: Dict[str, Optional[List[Tuple[str, Optional[str]]]]] = {}
+        for item in self._kb_items:
+            self._kb_by_category.setdefault(item.category, item)
+            for template in item.responses:
+                self._compiled_templates[template] = self._compile_template(template)
+        
+        # Per-category response sources, formatted once
+        self._sources_by_category: Dict[str, Tuple[str, str]] = {
+            category: (f"{category}.techedu.edu", "knowledge-base")
+            for category in self._kb_by_category
+        }
+    
+    @staticmethod
+    def _compile_template(template: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """
+        Parse a str.format template once into (literal, field_name) pairs.
+        
+        Returns None for templates using format specs, conversions or
+        attribute/index access; those keep going through str.format().
+        """
+        compiled = []
+        try:
+            for literal, field, spec, conversion in _FORMATTER.parse(template):
+                if field is not None and (spec or conversion or not field.isidentifier()):
+                    return None
+                compiled.append((literal, field))
+        except ValueError:
+            return None  # Malformed braces: str.format() would fail too
+        return compiled
+    
+    def _compile_intent_matcher(self):
+        """
+        Precompute intent keyword groups in priority order.
+        
+        classify_intent() scans (category, keywords) groups - escalation
+        first, then the knowledge base in order - and returns on the first
+        substring hit. Typical messages match an early keyword, so only
+        messages matching nothing pay for the full keyword list.
+        
+        Must be re-run if escalation_keywords or the knowledge base change.
+        """
+        self._intent_groups: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+            ("escalation", tuple(self.escalation_keywords)),
+            *((kb_item["category"], tuple(kb_item["keywords"]))
+              for kb_item in self.db.knowledge_base),
+        )
     
     def classify_intent(self, message: str) -> str:
         """
@@ -130,17 +380,42 @@ class AIService:
         """
         message_lower = message.lower()
         
-        # Check for escalation triggers first
-        if any(keyword in message_lower for keyword in self.escalation_keywords):
-            return "escalation"
-        
-        # Match against knowledge base categories
-        for kb_item in self.db.knowledge_base:
-            if any(keyword in message_lower for keyword in kb_item["keywords"]):
-                return kb_item["category"]
+        # Escalation triggers first, then knowledge base order
+        for category, keywords in self._intent_groups:
+            for keyword in keywords:
+                if keyword in message_lower:
+                    return category
         
         return "general"
-    
+
+    def classify_intent_many(self, messages: List[str]) -> List[str]:
+        """
+        Classify a batch of messages (log tagging, cache warming).
+
+        Same result as calling classify_intent() per message, but the
+        keyword groups are bound once for the whole batch.
+
+        PRODUCTION: Batch inference against the hosted classifier
+
+        Args:
+            messages: User query texts
+
+        Returns:
+            Category string per message, in input order
+        """
+        groups = self._intent_groups
+        results = []
+        append = results.append
+        for message in messages:
+            message_lower = message.lower()
+            for category, keywords in groups:
+                if any(keyword in message_lower for keyword in keywords):
+                    append(category)
+                    break
+            else:
+                append("general")
+        return results
+
     def generate_response(
         self, 
         message: str, 
@@ -186,34 +461,32 @@ class AIService:
         kb_item = self._find_knowledge_entry(category)
         
         if kb_item:
-            # Select and personalize response
+            # Select and personalize response. Not cached: the text carries
+            # live profile data (aid amounts, GPA) and templates are
+            # precompiled, so formatting costs microseconds.
             response_text = self._personalize_response(
-                kb_item["responses"],
+                kb_item.responses,
                 student_data
             )
             
             return QueryResponse(
                 text=response_text,
                 category=category,
-                confidence=self.HIGH_CONFIDENCE + random.uniform(-0.05, 0.05),
+                confidence=self.HIGH_CONFIDENCE + self._rng.uniform(-0.05, 0.05),
                 automated=True,
-                timestamp=datetime.now(),
-                sources=[f"{category}.techedu.edu", "knowledge-base"]
+                sources=list(self._sources_by_category[category])
             )
         
         # Fallback for unmatched queries
         return self._create_fallback_response(message, student_data)
     
-    def _find_knowledge_entry(self, category: str) -> Optional[Dict]:
+    def _find_knowledge_entry(self, category: str) -> Optional[_KBItem]:
         """Find knowledge base entry by category."""
-        for item in self.db.knowledge_base:
-            if item["category"] == category:
-                return item
-        return None
+        return self._kb_by_category.get(category)
     
     def _personalize_response(
         self, 
-        responses: List[str], 
+        responses: Tuple[str, ...], 
         student_data: Dict
     ) -> str:
         """
@@ -258,73 +531,21 @@ class AIService:
         - {library_fines}: Library fines
         """
         # Select random response from options
-        template = random.choice(responses)
+        template = self._rng.choice(responses)
         
-        # Extract nested data safely (now from legacy systems)
-        financial_aid = student_data.get("financial_aid", {})
-        housing = student_data.get("housing", {})
-        library = student_data.get("library", {})
-        courses = student_data.get("courses", [])
-        meal_plan = housing.get("meal_plan", {})
-        
-        # Calculate totals from detailed aid breakdown
-        grants_total = sum(g.get("amount", 0) for g in financial_aid.get("grants", []))
-        scholarships_total = sum(s.get("amount", 0) for s in financial_aid.get("scholarships", []))
-        loans_total = sum(l.get("amount", 0) for l in financial_aid.get("loans", []))
-        
-        # Personalize template with rich data
+        # Personalize template with rich data (values computed on demand)
+        values = _LazyStudentFields(student_data)
         try:
-            response = template.format(
-                # Basic info
-                name=student_data.get("name", "Student"),
-                first_name=student_data.get("first_name", student_data.get("name", "Student").split()[0]),
-                program=student_data.get("program", "N/A"),
-                year=student_data.get("year", "N/A"),
-                
-                # Academic data (from PeopleSoft)
-                gpa=student_data.get("gpa", "N/A"),
-                gpa_semester=student_data.get("gpa_semester", "N/A"),
-                credits_completed=student_data.get("credits_completed", 0),
-                credits_in_progress=student_data.get("credits_in_progress", 0),
-                academic_standing=student_data.get("academic_standing", "N/A"),
-                dean_list="Yes ⭐" if student_data.get("dean_list") else "No",
-                courseCount=len(courses),
-                semester=student_data.get("semester", "N/A"),
-                
-                # Financial aid (from PowerFAIDS) - detailed
-                amount=f"${financial_aid.get('total_aid', financial_aid.get('amount', 0)):,}",
-                total_aid=f"${financial_aid.get('total_aid', 0):,}",
-                remaining_balance=f"${financial_aid.get('remaining_balance', 0):,}",
-                date=financial_aid.get("next_disbursement", financial_aid.get("disbursement_date", "N/A")),
-                next_disbursement=financial_aid.get("next_disbursement", "N/A"),
-                grants_total=f"${grants_total:,}",
-                scholarships_total=f"${scholarships_total:,}",
-                loans_total=f"${loans_total:,}",
-                aid_status=financial_aid.get("status", "N/A"),
-                cost_of_attendance=f"${financial_aid.get('total_cost_of_attendance', 0):,}",
-                financial_need=f"${financial_aid.get('financial_need', 0):,}",
-                
-                # Housing (from StarRez) - detailed
-                building=housing.get("building", "N/A"),
-                room=housing.get("room", "N/A"),
-                room_type=housing.get("room_type", "N/A"),
-                floor=housing.get("floor", "N/A"),
-                meal_plan=meal_plan.get("name", "None"),
-                meals_per_week=meal_plan.get("meals_per_week", 0),
-                flex_remaining=f"${meal_plan.get('flex_remaining', 0)}",
-                move_in_date=housing.get("move_in_date", "N/A"),
-                move_out_date=housing.get("move_out_date", "N/A"),
-                
-                # Library (from Ex Libris)
-                library_items=library.get("items_checked_out", 0),
-                library_fines=f"${library.get('fines_owed', 0):.2f}",
-                library_overdue=library.get("items_overdue", 0)
-            )
+            compiled = self._compiled_templates.get(template)
+            if compiled is None:
+                return template.format_map(values)
+            return "".join([
+                literal if field is None else literal + format(values[field])
+                for literal, field in compiled
+            ])
         except KeyError as e:
             # If template uses a variable we don't have, use the template as-is
-            response = template
-        
-        return response
+            return template
     
     def _create_escalation_response(self, message: str) -> QueryResponse:
         """
@@ -343,21 +564,11 @@ class AIService:
         - Offer callback option
         """
         return QueryResponse(
-            text=(
-                "I understand this is an important matter that needs personal attention. "
-                "I've detected that your query may require human assistance.\n\n"
-                "**I can:**\n"
-                "• 🎫 Create a support ticket so our staff can help you personally\n"
-                "• 📞 Provide contact info: (555) 123-4567\n"
-                "• 📧 Email: support@techedu.edu\n\n"
-                "Click 'Talk to Support' below to create a ticket and connect with a staff member. "
-                "Average response time: 4-24 hours."
-            ),
+            text=_ESCALATION_TEXT,
             category="escalation",
             confidence=self.LOW_CONFIDENCE,  # Low confidence triggers "Talk to Support" link
             automated=False,
-            timestamp=datetime.now(),
-            sources=["support.techedu.edu"]
+            sources=list(_ESCALATION_SOURCES)
         )
     
     def _create_fallback_response(
@@ -373,25 +584,14 @@ class AIService:
         - Log for training data collection
         - Suggest similar questions that can be answered
         """
-        student_name = student_data.get("name", "").split()[0]  # First name
+        student_name = _first_word(student_data.get("name", ""))  # First name
         
         return QueryResponse(
-            text=(
-                f"Hi {student_name}! I'm not quite sure I understood your question correctly. "
-                "Here are some things I can help you with:\n\n"
-                "• 💰 **Financial Aid** - Scholarships, payments, FAFSA\n"
-                "• 📚 **Registration** - Courses, enrollment, schedules\n"
-                "• 📊 **Grades & GPA** - Transcripts, academic records\n"
-                "• 🏠 **Housing** - Dorms, room assignments, maintenance\n"
-                "• 🎓 **Admissions** - Applications, requirements\n"
-                "• 💼 **Career Services** - Jobs, internships, resume help\n\n"
-                "Could you rephrase your question? Or if you need human assistance, click 'Talk to Support' below."
-            ),
+            text=f"Hi {student_name}! {_FALLBACK_TEXT}",
             category="general",
             confidence=0.30,  # Low confidence triggers "Talk to Support" link
             automated=True,
-            timestamp=datetime.now(),
-            sources=["help.techedu.edu"]
+            sources=list(_FALLBACK_SOURCES)
         )
     
     def search_knowledge_base(self, query: str, limit: int = 5) -> Dict:
@@ -408,29 +608,48 @@ class AIService:
         Returns:
             Dict with query, results, and count
         """
-        query_lower = query.lower()
-        results = []
-        
-        for item in self.db.knowledge_base:
-            # Check if any keywords match
-            matching_keywords = [
-                kw for kw in item["keywords"] 
-                if kw in query_lower
-            ]
-            
-            if matching_keywords:
-                results.append({
-                    "category": item["category"],
-                    "matched_keywords": matching_keywords,
-                    "sample_response": item["responses"][0] if item["responses"] else None
-                })
-                
-                if len(results) >= limit:
-                    break
-        
+        query_lower = query.lower().strip()
+        cache_key = (query_lower, limit)
+        
+        hits = self._search_cache.get(cache_key)
+        if hits is not None:
+            self._search_cache.move_to_end(cache_key)
+        else:
+            hits = self._search_keywords(query_lower, limit)
+            self._search_cache[cache_key] = hits
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        
+        results = [
+            {
+                "category": hit.category,
+                "matched_keywords": list(hit.matched_keywords),
+                "sample_response": hit.sample_response
+            }
+            for hit in hits
+        ]
         return {
             "query": query,
             "results": results,
             "count": len(results),
             "search_type": "keyword"  # PRODUCTION: "semantic"
-        }
\ No newline at end of file
+        }
+    
+    def _search_keywords(self, query_lower: str, limit: int) -> Tuple[_SearchHit, ...]:
+        """
+        Keyword scan over the knowledge base (uncached).
+        
+        Hits are listed in knowledge base order with keywords in list order.
+        """
+        hits: List[_SearchHit] = []
+        for item in self._kb_items:
+            if len(hits) >= limit:
+                break
+            matched_keywords = tuple(kw for kw in item.keywords if kw in query_lower)
+            if matched_keywords:
+                hits.append(_SearchHit(
+                    item.category,
+                    matched_keywords,
+                    item.responses[0] if item.responses else None
+                ))
+        return tuple(hits)
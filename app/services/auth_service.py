@@ -7,7 +7,7 @@ Handles user authentication, JWT token management, and authorization.
 
 MVP IMPLEMENTATION:
 - JWT tokens with configurable expiration
-- Password hashing with bcrypt
+- Salted scrypt password hashing (stdlib)
 - In-memory user store
 
 PRODUCTION ENHANCEMENTS:
@@ -26,11 +26,14 @@ SECURITY NOTES:
 
 import os
 import hashlib
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import hmac
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
 
 # ================================================================================
 # CONFIGURATION
@@ -48,15 +51,44 @@ SECRET_KEY = os.getenv("SECRET_KEY", "mvp-demo-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("TOKEN_EXPIRE_MINUTES", "30"))
 
-# Simple password functions for MVP (avoiding bcrypt compatibility issues)
-# PRODUCTION: Use proper bcrypt via passlib with compatible versions
+# Verified-token cache: skip JWT signature checks for recently seen tokens
+TOKEN_CACHE_SIZE = 4096
+TOKEN_CACHE_TTL = 60  # seconds, never beyond the token's own expiry
+
+# Password hashing for MVP: salted scrypt from the standard library.
+# Single implementation: MockDatabase imports simple_hash for its seed users.
+# PRODUCTION: Argon2id / bcrypt via passlib with compatible versions
+SCRYPT_N = 2 ** 14  # CPU/memory cost (16 MiB with r=8)
+SCRYPT_R = 8
+SCRYPT_P = 1
+
 def simple_hash(password: str) -> str:
-    """Simple SHA-256 hash for MVP demo. NOT for production use."""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """
+    Salted scrypt hash, stored as "scrypt$n$r$p$salt_hex$digest_hex".
+    
+    Cost parameters travel with the hash, so stored hashes keep verifying
+    if SCRYPT_N/R/P are raised later.
+    """
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(
+        password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=32
+    )
+    return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
 
 def simple_verify(password: str, hashed: str) -> bool:
-    """Verify password against simple hash."""
-    return simple_hash(password) == hashed
+    """Verify password against a stored scrypt hash (constant-time comparison)."""
+    try:
+        scheme, n, r, p, salt, digest = hashed.split("$")
+        if scheme != "scrypt":
+            return False
+        expected = bytes.fromhex(digest)
+        candidate = hashlib.scrypt(
+            password.encode(), salt=bytes.fromhex(salt),
+            n=int(n), r=int(r), p=int(p), dklen=len(expected)
+        )
+    except ValueError:
+        return False  # Malformed stored hash
+    return hmac.compare_digest(candidate, expected)
 
 # OAuth2 scheme for token extraction from request headers
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -89,12 +121,18 @@ class AuthService:
             db: MockDatabase instance (or real DB in production)
         """
         self.db = db
+        
+        # Bounded LRU of verified tokens.
+        # Key: blake2b digest of the token → (valid until epoch seconds, username)
+        # Digests keep memory bounded and raw tokens out of memory dumps.
+        # PRODUCTION: Shared Redis cache, checked against the revocation list
+        self._token_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verify a password against its hash.
         
-        MVP: Uses simple SHA-256 hash.
+        MVP: Uses salted scrypt (hashlib).
         PRODUCTION: Use bcrypt for secure password comparison.
         """
         return simple_verify(plain_password, hashed_password)
@@ -103,7 +141,7 @@ class AuthService:
         """
         Hash a password for storage.
         
-        MVP: Uses simple SHA-256 hash.
+        MVP: Uses salted scrypt (hashlib) with a random 16-byte salt.
         PRODUCTION: Use bcrypt with automatic salt generation.
         """
         return simple_hash(password)
@@ -173,14 +211,16 @@ class AuthService:
         """
         to_encode = data.copy()
         
+        # Claims as integer epoch seconds (RFC 7519 NumericDate)
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expires_seconds = int(expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            expires_seconds = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        now = int(time.time())
         
         to_encode.update({
-            "exp": expire,
-            "iat": datetime.utcnow(),
+            "exp": now + expires_seconds,
+            "iat": now,
             "type": "access"
         })
         
@@ -204,6 +244,10 @@ class AuthService:
         3. Lookup user from token subject
         4. Return user data or raise 401
         
+        CACHING: A verified token is trusted for up to TOKEN_CACHE_TTL
+        seconds (never past its "exp") without re-checking the signature.
+        The user is still looked up on every call.
+        
         PRODUCTION:
         - Cache user lookups (Redis)
         - Validate token against revocation list
@@ -224,20 +268,37 @@ class AuthService:
             headers={"WWW-Authenticate": "Bearer"},
         )
         
-        try:
-            # Decode token
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            username: str = payload.get("sub")
-            
-            if username is None:
-                raise credentials_exception
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.time()
+        cached = self._token_cache.get(cache_key)
+        if cached is not None and cached[0] > now:
+            self._token_cache.move_to_end(cache_key)
+            username = cached[1]
+        else:
+            try:
+                # Decode token
+                payload = jwt.decode(
+                    token, SECRET_KEY, algorithms=[ALGORITHM],
+                    options={"require": ["exp", "sub", "type"]}
+                )
+                username: str = payload.get("sub")
                 
-            # Check token type
-            if payload.get("type") != "access":
+                if username is None:
+                    raise credentials_exception
+                    
+                # Check token type
+                if payload.get("type") != "access":
+                    raise credentials_exception
+                    
+            except jwt.PyJWTError:
+                self._token_cache.pop(cache_key, None)
                 raise credentials_exception
-                
-        except JWTError:
-            raise credentials_exception
+            
+            valid_until = min(payload.get("exp", now), now + TOKEN_CACHE_TTL)
+            self._token_cache[cache_key] = (valid_until, username)
+            self._token_cache.move_to_end(cache_key)
+            if len(self._token_cache) > TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
         
         # Lookup user
         user = self.db.get_user(username)
@@ -83,8 +83,14 @@ This service mocks the ESB behavior by:
 ================================================================================
 """
 
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+import random
+import threading
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+import time
 
 # Import legacy system connectors - these would be real API clients in production
 from app.data.legacy_systems import (
@@ -97,6 +103,301 @@ from app.data.legacy_systems import (
 )
 
 
+# Connected backend systems: static configuration shared by all ESBService
+# instances. Each is an on-premise legacy application the ESB integrates
+# with; last_sync is stamped when the integration status is built.
+SYSTEM_CONFIGS: Tuple[Dict, ...] = (
+    {
+        "id": "admissions",
+        "name": "Student Admissions System",
+        "vendor": "Ellucian Banner",
+        "protocol": "SOAP/XML",
+        "location": "on-premise",
+        "status": "operational",
+        "data_provided": ["student_id", "name", "email", "program", "year"],
+        "compliance": ["FERPA"]
+    },
+    {
+        "id": "academic",
+        "name": "Academic Records System",
+        "vendor": "PeopleSoft Campus Solutions",
+        "protocol": "JDBC/SQL",
+        "location": "on-premise",
+        "status": "operational",
+        "data_provided": ["courses", "grades", "gpa", "transcript"],
+        "compliance": ["FERPA"]
+    },
+    {
+        "id": "financial",
+        "name": "Financial Aid Management",
+        "vendor": "PowerFAIDS",
+        "protocol": "REST/JSON",
+        "location": "on-premise",
+        "status": "operational",
+        "data_provided": ["financial_aid", "scholarships", "loans", "disbursements"],
+        "compliance": ["FERPA", "PCI-DSS"]
+    },
+    {
+        "id": "housing",
+        "name": "Housing Management System",
+        "vendor": "StarRez",
+        "protocol": "REST/JSON",
+        "location": "on-premise",
+        "status": "operational",
+        "data_provided": ["housing", "room_assignment", "meal_plan"],
+        "compliance": []
+    },
+    {
+        "id": "directory",
+        "name": "Directory Services",
+        "vendor": "Microsoft Active Directory",
+        "protocol": "LDAP",
+        "location": "on-premise",
+        "status": "operational",
+        "data_provided": ["authentication", "email", "groups"],
+        "compliance": []
+    }
+)
+
+
+# Optional profile sections: the legacy connector that supplies each one
+# and the unified-profile keys it fills. Admissions (core identity) is
+# always queried.
+_SECTION_CONNECTORS = {
+    "academic": academic_system.get_academic_record,
+    "financial": financial_system.get_financial_aid,
+    "housing": housing_system.get_housing,
+    "library": library_system.get_library_account
+}
+
+_SECTION_KEYS: Dict[str, Tuple[str, ...]] = {
+    "academic": (
+        "year", "gpa", "gpa_semester", "credits_completed", "credits_in_progress",
+        "academic_standing", "dean_list", "courses", "semester"
+    ),
+    "financial": ("financial_aid",),
+    "housing": ("housing",),
+    "library": ("library",)
+}
+
+
+# Unified-profile fallbacks for a legacy system that did not respond,
+# keyed by the system's own field names. Scalars only: empty lists and
+# dicts are created per profile in _build_unified_profile() so no two
+# profiles share a container.
+_ACADEMIC_DEFAULTS = {
+    "year_level": None,
+    "gpa_cumulative": None,
+    "gpa_semester": None,
+    "credits_completed": 0,
+    "credits_in_progress": 0,
+    "academic_standing": "Unknown",
+    "dean_list": False,
+    "semester": None
+}
+
+_FINANCIAL_DEFAULTS = {
+    "status": "Not Available",
+    "aid_year": None,
+    "total_cost_of_attendance": 0,
+    "expected_family_contribution": 0,
+    "financial_need": 0,
+    "total_aid": 0,
+    "remaining_balance": 0,
+    "next_disbursement": None,
+    "satisfactory_academic_progress": True
+}
+
+_HOUSING_DEFAULTS = {
+    "assignment_status": "Not Assigned",
+    "building": None,
+    "building_code": None,
+    "room_number": None,
+    "room_type": None,
+    "floor": None,
+    "roommate_id": None,
+    "move_in_date": None,
+    "move_out_date": None,
+    "access_card": None,
+    "parking_permit": None
+}
+
+_LIBRARY_DEFAULTS = {
+    "library_id": None,
+    "items_checked_out": 0,
+    "items_overdue": 0,
+    "fines_owed": 0.0,
+    "hold_requests": 0
+}
+
+
+# Legacy systems the ESB calls; each has its own circuit breaker and pool
+LEGACY_SYSTEM_IDS: Tuple[str, ...] = (
+    "admissions", "academic", "financial", "housing", "library", "directory"
+)
+
+
+# Static sections of the integration status document, shared by every
+# status build (read-only: callers must not mutate them)
+_STATUS_STATIC_SECTIONS: Dict = {
+    "message_flow": {
+        "daily_messages": 15420,
+        "success_rate": 99.7,
+        "avg_latency_ms": 45,
+        "queue_depth": 12
+    },
+    "security": {
+        "authentication": "OAuth2 + Service Accounts",
+        "encryption": "TLS 1.3 in transit, AES-256 at rest",
+        "audit_logging": "enabled"
+    },
+    "architecture_notes": {
+        "pattern": "Hub-and-Spoke ESB",
+        "cloud_components": [
+            "API Gateway",
+            "AI Service",
+            "Analytics Pipeline",
+            "Cache Layer"
+        ],
+        "on_premise_components": [
+            "Admissions System (Banner)",
+            "Academic Records (PeopleSoft)",
+            "Financial Aid (PowerFAIDS)",
+            "Housing (StarRez)",
+            "Directory Services (AD/LDAP)"
+        ],
+        "why_hybrid": (
+            "Student data systems remain on-premise for FERPA/PCI compliance. "
+            "Cloud provides scalable AI processing and modern API layer."
+        )
+    }
+}
+
+
+def _omit_sections(profile: Dict, skipped: List[str]) -> Dict:
+    """
+    Drop the keys of skipped sections and describe only the systems that
+    remain in _esb_metadata (in place; returns the profile).
+    
+    The metadata dict is replaced, not edited, so a copy served from the
+    profile cache never alters the cached entry.
+    """
+    if not skipped:
+        return profile
+    for name in skipped:
+        for key in _SECTION_KEYS[name]:
+            del profile[key]
+    metadata = profile["_esb_metadata"]
+    aggregated_from = [name for name in metadata["aggregated_from"] if name not in skipped]
+    profile["_esb_metadata"] = {
+        **metadata,
+        "aggregated_from": aggregated_from,
+        "systems_queried": 1 + len(_SECTION_CONNECTORS) - len(skipped),
+        "systems_responded": len(aggregated_from)
+    }
+    return profile
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a legacy system whose circuit is open."""
+
+
+class TransientError(RuntimeError):
+    """A legacy system call failed in a way worth retrying (timeout, 503)."""
+
+
+class PermanentError(RuntimeError):
+    """A legacy system call failed for good (bad request, not found)."""
+
+
+# Connector failures retried by ESBService._call_system; anything else
+# (PermanentError, CircuitOpenError, programming errors) fails at once.
+# asyncio.TimeoutError is listed for Python 3.10, where it is not TimeoutError.
+_RETRYABLE_ERRORS = (TransientError, TimeoutError, asyncio.TimeoutError, ConnectionError)
+
+# A legacy system could not be reached (open circuit, or retries
+# exhausted): API handlers answer 503 Service Unavailable for these
+UNAVAILABLE_ERRORS = (CircuitOpenError, *_RETRYABLE_ERRORS)
+
+
+class CircuitBreaker:
+    """
+    Failure isolation for one legacy system (closed → open → half-open).
+    
+    After fail_max consecutive failures the circuit opens and calls fail
+    fast for reset_timeout seconds. Then exactly one caller is let through
+    as a trial (others keep failing fast while it is in flight): success
+    closes the circuit, failure re-opens it.
+    
+    Callers bracket each call: before_call(), then record_success(),
+    record_failure() or (if cancelled) abandon_call(). A PermanentError
+    means the system answered (it rejected the request), so it is recorded
+    as a success for the circuit. All state changes happen under one lock.
+    
+    PRODUCTION: Shared state across workers (Redis) or the ESB/API
+    gateway's built-in breaker policy.
+    """
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half-open"."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+    
+    def before_call(self) -> bool:
+        """
+        Admit a call, or raise CircuitOpenError.
+        
+        Closed: always admitted. Open: rejected until reset_timeout has
+        passed; then the first caller becomes the half-open trial and the
+        rest are rejected until it is recorded.
+        
+        Returns:
+            True if this call is the half-open trial
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if (time.monotonic() - self._opened_at < self.reset_timeout
+                    or self._trial_in_flight):
+                raise CircuitOpenError("circuit open")
+            self._trial_in_flight = True
+            return True
+    
+    def record_success(self) -> None:
+        """The system answered: close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        """The call failed or timed out: count it, open or re-open."""
+        with self._lock:
+            self.failures += 1
+            if self._opened_at is not None or self.failures >= self.fail_max:
+                self._opened_at = time.monotonic()  # Open, or re-open after a failed trial
+            self._trial_in_flight = False
+    
+    def abandon_call(self, trial: bool) -> None:
+        """The caller cancelled: free the trial slot (if held), no verdict."""
+        if trial:
+            with self._lock:
+                self._trial_in_flight = False
+
+
 class ESBService:
     """
     Enterprise Service Bus integration layer.
@@ -121,74 +422,55 @@ class ESBService:
         self.db = db
         
         # Simulated system configurations
-        self._systems = self._init_system_configs()
-    
-    def _init_system_configs(self) -> List[Dict]:
-        """
-        Define connected backend systems.
+        self._systems = SYSTEM_CONFIGS
+        self._systems_by_id: Dict[str, Dict] = {s["id"]: s for s in self._systems}
         
-        Each system represents an on-premise legacy application
-        that the ESB integrates with.
-        """
-        return [
-            {
-                "id": "admissions",
-                "name": "Student Admissions System",
-                "vendor": "Ellucian Banner",
-                "protocol": "SOAP/XML",
-                "location": "on-premise",
-                "status": "operational",
-                "data_provided": ["student_id", "name", "email", "program", "year"],
-                "compliance": ["FERPA"],
-                "last_sync": datetime.now().isoformat()
-            },
-            {
-                "id": "academic",
-                "name": "Academic Records System",
-                "vendor": "PeopleSoft Campus Solutions",
-                "protocol": "JDBC/SQL",
-                "location": "on-premise",
-                "status": "operational",
-                "data_provided": ["courses", "grades", "gpa", "transcript"],
-                "compliance": ["FERPA"],
-                "last_sync": datetime.now().isoformat()
-            },
-            {
-                "id": "financial",
-                "name": "Financial Aid Management",
-                "vendor": "PowerFAIDS",
-                "protocol": "REST/JSON",
-                "location": "on-premise",
-                "status": "operational",
-                "data_provided": ["financial_aid", "scholarships", "loans", "disbursements"],
-                "compliance": ["FERPA", "PCI-DSS"],
-                "last_sync": datetime.now().isoformat()
-            },
-            {
-                "id": "housing",
-                "name": "Housing Management System",
-                "vendor": "StarRez",
-                "protocol": "REST/JSON",
-                "location": "on-premise",
-                "status": "operational",
-                "data_provided": ["housing", "room_assignment", "meal_plan"],
-                "compliance": [],
-                "last_sync": datetime.now().isoformat()
-            },
-            {
-                "id": "directory",
-                "name": "Directory Services",
-                "vendor": "Microsoft Active Directory",
-                "protocol": "LDAP",
-                "location": "on-premise",
-                "status": "operational",
-                "data_provided": ["authentication", "email", "groups"],
-                "compliance": [],
-                "last_sync": datetime.now().isoformat()
-            }
-        ]
+        # Integration status is polled by dashboards but changes rarely.
+        # Cache: (monotonic expiry time, status dict)
+        # PRODUCTION: Shared Redis key with the same TTL
+        self.STATUS_CACHE_TTL = 30  # seconds
+        self._status_cache: Optional[Tuple[float, Dict]] = None
+        
+        # Unified profiles, bounded LRU with per-entry TTL.
+        # Key: student_id → (monotonic expiry time, profile)
+        # PRODUCTION: Redis tier shared by all workers, same TTL
+        self.PROFILE_CACHE_TTL = 300  # seconds
+        self.PROFILE_CACHE_SIZE = 10000
+        self._profile_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        
+        # One circuit breaker per legacy system, keyed by system id
+        self._breakers: Dict[str, CircuitBreaker] = {
+            system_id: CircuitBreaker(fail_max=5, reset_timeout=30)
+            for system_id in LEGACY_SYSTEM_IDS
+        }
+        
+        # Each connector attempt is bounded, so a hanging system counts as a
+        # failure for its breaker instead of stalling the request
+        self.CALL_TIMEOUT = 2.0  # seconds, per attempt
+        
+        # Transient connector failures are retried with exponential
+        # backoff and full jitter: delay = uniform(0, min(max, base * 2^n))
+        self.RETRY_ATTEMPTS = 3
+        self.RETRY_BASE_DELAY = 0.05  # seconds
+        self.RETRY_MAX_DELAY = 0.5  # seconds
+        
+        # Bulkheads: each legacy system gets its own bounded worker pool,
+        # so a slow system can only tie up its own threads, never the
+        # capacity the other systems (or the server) need.
+        self.POOL_WORKERS_PER_SYSTEM = 8
+        self._pools: Dict[str, ThreadPoolExecutor] = {
+            system_id: ThreadPoolExecutor(
+                max_workers=self.POOL_WORKERS_PER_SYSTEM,
+                thread_name_prefix=f"esb-{system_id}"
+            )
+            for system_id in LEGACY_SYSTEM_IDS
+        }
     
-    def get_unified_student_profile(self, student_id: str) -> Optional[Dict]:
+    async def get_unified_student_profile(
+        self,
+        student_id: str,
+        sections: Optional[Set[str]] = None
+    ) -> Optional[Dict]:
         """
         Get unified student profile aggregating data from all systems.
         
@@ -197,7 +479,7 @@ class ESBService:
         ╠═══════════════════════════════════════════════════════════════╣
         ║                                                               ║
         ║  1. Receive student_id request                                ║
-        ║  2. Query each connected system (parallel in production):     ║
+        ║  2. Query Admissions, then the other systems concurrently:    ║
         ║     • Admissions → Basic info                                 ║
         ║     • Academic → Courses, GPA                                 ║
         ║     • Financial → Aid package                                 ║
@@ -210,60 +492,294 @@ class ESBService:
         ║                                                               ║
         ╚═══════════════════════════════════════════════════════════════╝
         
-        PRODUCTION IMPLEMENTATION:
-        ```python
-        async def get_unified_student_profile(self, student_id: str):
-            # Parallel calls to all systems
-            results = await asyncio.gather(
-                self._call_admissions(student_id),
-                self._call_academic(student_id),
-                self._call_financial(student_id),
-                self._call_housing(student_id),
-                return_exceptions=True
-            )
-            
-            # Handle partial failures gracefully
-            profile = self._merge_results(results)
-            
-            # Cache for 5 minutes
-            await cache.set(f"student:{student_id}", profile, ttl=300)
-            
-            return profile
-        ```
+        CONCURRENCY: Admissions is called first (no record → no profile);
+        the other four systems are then awaited together with
+        asyncio.gather(return_exceptions=True), so one failing system
+        degrades the profile instead of failing the request.
+        
+        CACHING: Profiles are reused for PROFILE_CACHE_TTL seconds; a hit
+        returns a copy with _esb_metadata.cache_hit set. Degraded profiles
+        (a system call failed, timed out or hit an open circuit, so its
+        section holds defaults) are not cached, so the next read retries
+        that system. A system that simply has no record for the student
+        does not count as degraded. Call
+        invalidate_student_profile() after writes to a student's data.
+        Nested sections are shared with the cached entry: treat them as
+        read-only.
+        
+        PARTIAL PROFILES: With sections (subset of "academic", "financial",
+        "housing", "library"), only those systems are called besides
+        Admissions; the other sections' keys are left out and
+        _esb_metadata lists only the included systems. Partial profiles
+        are not cached, but a cached full profile serves them.
+        
+        PRODUCTION: _call_system() awaits each subsystem's API over a
+        shared HTTP client.
         
         Args:
             student_id: Student identifier
+            sections: Profile sections to include (default: all)
             
         Returns:
             Unified student profile dict or None if not found
+            
+        Raises:
+            ValueError: sections names an unknown section
         """
         # =================================================================
         # ESB INTEGRATION: Call each legacy system and aggregate data
         # In production, these would be actual API/DB calls
         # =================================================================
         
+        if sections is None:
+            skipped: List[str] = []
+        else:
+            unknown = sections - _SECTION_CONNECTORS.keys()
+            if unknown:
+                raise ValueError(f"Unknown profile sections: {sorted(unknown)}")
+            skipped = [name for name in _SECTION_CONNECTORS if name not in sections]
+        
+        now = time.monotonic()
+        cached = self._cached_profile(student_id, now)
+        if cached is not None:
+            return _omit_sections(cached, skipped)
+        
         # 1. Call Admissions System (Banner) - Basic student info
-        admissions_data = admissions_system.get_student(student_id)
+        #    Core identity: without it there is no profile to build
+        admissions_data = await self._call_system(
+            "admissions", admissions_system.get_student, student_id
+        )
         if not admissions_data:
             return None  # Student not found
         
-        # 2. Call Academic Records System (PeopleSoft) - Courses, GPA
-        academic_data = academic_system.get_academic_record(student_id)
+        # 2-5. Call the remaining (requested) systems concurrently: latency
+        #      is the slowest single system instead of the sum of all four.
+        #      A failing system counts as "did not respond".
+        #      Academic (PeopleSoft), Financial Aid (PowerFAIDS),
+        #      Housing (StarRez), Library (Ex Libris)
+        queried = [name for name in _SECTION_CONNECTORS if name not in skipped]
+        results = await asyncio.gather(
+            *(
+                self._call_system(name, _SECTION_CONNECTORS[name], student_id)
+                for name in queried
+            ),
+            return_exceptions=True
+        )
+        section_data: Dict[str, Optional[Dict]] = dict.fromkeys(_SECTION_CONNECTORS)
+        degraded = False
+        for name, result in zip(queried, results):
+            if isinstance(result, BaseException):
+                degraded = True
+            else:
+                section_data[name] = result
+        
+        unified_profile = self._build_unified_profile(
+            admissions_data,
+            section_data["academic"],
+            section_data["financial"],
+            section_data["housing"],
+            section_data["library"]
+        )
+        
+        if skipped:
+            unified_profile = _omit_sections(unified_profile, skipped)
+        elif not degraded:
+            self._cache_profile(student_id, unified_profile, now)
+        return unified_profile
+    
+    async def get_unified_student_profiles(
+        self,
+        student_ids: List[str],
+        batch_timeout: float = 5.0,
+        cache: bool = True
+    ) -> Dict[str, Dict]:
+        """
+        Get unified profiles for many students with one call per system.
+        
+        Same schema as get_unified_student_profile(), but each legacy
+        system is asked once for the whole batch (IN-list / multi-get)
+        instead of once per student. Cached profiles are served first;
+        only the misses are fetched. If any bulk call fails the batch is
+        degraded and none of its profiles are cached. With cache=False
+        fetched profiles are not stored either, for one-off sweeps that
+        would otherwise flush the working set from the cache.
+        
+        CONCURRENCY: Admissions is called first to find which students
+        exist; the other four bulk calls are then awaited together. Each
+        is bounded by batch_timeout seconds: a slow or failing system
+        degrades every profile in the batch instead of stalling it.
+        
+        Args:
+            student_ids: Student identifiers (duplicates are ignored)
+            batch_timeout: Per-system timeout for the bulk calls, seconds
+            cache: Store the fetched profiles in the profile cache
+            
+        Returns:
+            Dict of student_id → unified profile; unknown IDs are omitted
+        """
+        now = time.monotonic()
+        profiles: Dict[str, Dict] = {}
+        missing: List[str] = []
+        for student_id in dict.fromkeys(student_ids):
+            cached = self._cached_profile(student_id, now)
+            if cached is not None:
+                profiles[student_id] = cached
+            else:
+                missing.append(student_id)
+        if not missing:
+            return profiles
         
-        # 3. Call Financial Aid System (PowerFAIDS) - Aid package
-        financial_data = financial_system.get_financial_aid(student_id)
+        try:
+            admissions = await asyncio.wait_for(
+                self._call_system("admissions", admissions_system.get_students_bulk, missing),
+                batch_timeout
+            )
+        except Exception:
+            # Without core identity no profile can be built; report none
+            # rather than fail the whole batch
+            return profiles
+        found = [student_id for student_id in missing if student_id in admissions]
+        if not found:
+            return profiles
         
-        # 4. Call Housing System (StarRez) - Room assignment
-        housing_data = housing_system.get_housing(student_id)
+        results = await asyncio.gather(
+            asyncio.wait_for(
+                self._call_system("academic", academic_system.get_academic_records_bulk, found),
+                batch_timeout
+            ),
+            asyncio.wait_for(
+                self._call_system("financial", financial_system.get_financial_aid_bulk, found),
+                batch_timeout
+            ),
+            asyncio.wait_for(
+                self._call_system("housing", housing_system.get_housing_bulk, found),
+                batch_timeout
+            ),
+            asyncio.wait_for(
+                self._call_system("library", library_system.get_library_accounts_bulk, found),
+                batch_timeout
+            ),
+            return_exceptions=True
+        )
+        degraded = any(isinstance(result, BaseException) for result in results)
+        academic, financial, housing, library = (
+            {} if isinstance(result, BaseException) else result
+            for result in results
+        )
+        
+        timestamp = datetime.now().isoformat()  # One clock read for the batch
+        for student_id in found:
+            profile = self._build_unified_profile(
+                admissions[student_id],
+                academic.get(student_id),
+                financial.get(student_id),
+                housing.get(student_id),
+                library.get(student_id),
+                timestamp
+            )
+            if cache and not degraded:
+                self._cache_profile(student_id, profile, now)
+            profiles[student_id] = profile
+        return profiles
+    
+    async def iter_unified_student_profiles(
+        self,
+        student_ids: List[str],
+        chunk_size: int = 32,
+        batch_timeout: float = 5.0
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield unified profiles batch by batch, for streaming exports.
+        
+        Student IDs are fetched chunk_size at a time through
+        get_unified_student_profiles(), and each batch is yielded before
+        the next is requested: memory stays bounded by one batch and the
+        first profiles reach the client while the rest are still loading.
+        Cached profiles are served, but fetched ones are not added to the
+        profile cache. Unknown IDs are skipped; order follows student_ids.
+        """
+        for start in range(0, len(student_ids), chunk_size):
+            chunk = student_ids[start:start + chunk_size]
+            profiles = await self.get_unified_student_profiles(
+                chunk, batch_timeout, cache=False
+            )
+            for student_id in chunk:
+                profile = profiles.pop(student_id, None)
+                if profile is not None:
+                    yield profile
+    
+    def _cached_profile(self, student_id: str, now: float) -> Optional[Dict]:
+        """Return a live cached profile marked as a cache hit, else None."""
+        cached = self._profile_cache.get(student_id)
+        if cached is None:
+            return None
+        if cached[0] <= now:
+            del self._profile_cache[student_id]
+            return None
+        self._profile_cache.move_to_end(student_id)
+        profile = dict(cached[1])
+        profile["_esb_metadata"] = {
+            **profile["_esb_metadata"],
+            "cache_hit": True,
+            "data_freshness": "cached"
+        }
+        return profile
+    
+    def _cache_profile(self, student_id: str, profile: Dict, now: float) -> None:
+        """
+        Store a freshly built profile, evicting the least recently used.
         
-        # 5. Call Library System (Ex Libris) - Library account
-        library_data = library_system.get_library_account(student_id)
+        Callers skip degraded profiles: default sections standing in for a
+        failed system must not outlive the outage.
+        """
+        self._profile_cache[student_id] = (now + self.PROFILE_CACHE_TTL, profile)
+        if len(self._profile_cache) > self.PROFILE_CACHE_SIZE:
+            self._profile_cache.popitem(last=False)
+    
+    def _build_unified_profile(
+        self,
+        admissions_data: Dict,
+        academic_data: Optional[Dict],
+        financial_data: Optional[Dict],
+        housing_data: Optional[Dict],
+        library_data: Optional[Dict],
+        timestamp: Optional[str] = None
+    ) -> Dict:
+        """
+        Transform per-system records into the unified profile schema.
         
+        A system that did not respond is passed as None and its section
+        falls back to defaults. Batch callers pass one ISO timestamp for
+        every profile they build; otherwise the clock is read here.
+        """
         # =================================================================
         # DATA TRANSFORMATION: Merge into unified profile schema
         # This is where ESB transforms different formats into one schema
         # =================================================================
         
+        # Missing systems fall back to their defaults; fields are then
+        # read unconditionally. Empty containers are fresh per profile.
+        academic = {**_ACADEMIC_DEFAULTS, "courses": [], **(academic_data or {})}
+        financial = {
+            **_FINANCIAL_DEFAULTS, "package": {}, "disbursements": [],
+            **(financial_data or {})
+        }
+        package = {
+            "grants": [], "scholarships": [], "loans": [], "work_study": {},
+            **financial["package"]
+        }
+        housing = {**_HOUSING_DEFAULTS, "meal_plan": {}, **(housing_data or {})}
+        library = {**_LIBRARY_DEFAULTS, **(library_data or {})}
+        
+        pairs = (
+            ("admissions", admissions_data),
+            ("academic", academic_data),
+            ("financial", financial_data),
+            ("housing", housing_data),
+            ("library", library_data)
+        )
+        responded = [name for name, data in pairs if data]
+        
         unified_profile = {
             # Core identity from Admissions
             "id": admissions_data["student_id"],
@@ -280,88 +796,136 @@ class ESBService:
             "status": admissions_data["status"],
             
             # Academic data from PeopleSoft
-            "year": academic_data["year_level"] if academic_data else None,
-            "gpa": academic_data["gpa_cumulative"] if academic_data else None,
-            "gpa_semester": academic_data["gpa_semester"] if academic_data else None,
-            "credits_completed": academic_data["credits_completed"] if academic_data else 0,
-            "credits_in_progress": academic_data["credits_in_progress"] if academic_data else 0,
-            "academic_standing": academic_data["academic_standing"] if academic_data else "Unknown",
-            "dean_list": academic_data["dean_list"] if academic_data else False,
-            "courses": academic_data["courses"] if academic_data else [],
-            "semester": academic_data["semester"] if academic_data else None,
+            "year": academic["year_level"],
+            "gpa": academic["gpa_cumulative"],
+            "gpa_semester": academic["gpa_semester"],
+            "credits_completed": academic["credits_completed"],
+            "credits_in_progress": academic["credits_in_progress"],
+            "academic_standing": academic["academic_standing"],
+            "dean_list": academic["dean_list"],
+            "courses": academic["courses"],
+            "semester": academic["semester"],
             
             # Financial Aid from PowerFAIDS (detailed breakdown)
             "financial_aid": {
-                "status": financial_data["status"] if financial_data else "Not Available",
-                "aid_year": financial_data["aid_year"] if financial_data else None,
-                "total_cost_of_attendance": financial_data["total_cost_of_attendance"] if financial_data else 0,
-                "expected_family_contribution": financial_data["expected_family_contribution"] if financial_data else 0,
-                "financial_need": financial_data["financial_need"] if financial_data else 0,
-                "total_aid": financial_data["total_aid"] if financial_data else 0,
-                "remaining_balance": financial_data["remaining_balance"] if financial_data else 0,
-                "next_disbursement": financial_data["next_disbursement"] if financial_data else None,
-                "satisfactory_academic_progress": financial_data["satisfactory_academic_progress"] if financial_data else True,
+                "status": financial["status"],
+                "aid_year": financial["aid_year"],
+                "total_cost_of_attendance": financial["total_cost_of_attendance"],
+                "expected_family_contribution": financial["expected_family_contribution"],
+                "financial_need": financial["financial_need"],
+                "total_aid": financial["total_aid"],
+                "remaining_balance": financial["remaining_balance"],
+                "next_disbursement": financial["next_disbursement"],
+                "satisfactory_academic_progress": financial["satisfactory_academic_progress"],
                 # Detailed package breakdown
-                "grants": financial_data["package"]["grants"] if financial_data else [],
-                "scholarships": financial_data["package"]["scholarships"] if financial_data else [],
-                "loans": financial_data["package"]["loans"] if financial_data else [],
-                "work_study": financial_data["package"]["work_study"] if financial_data else {},
-                "disbursements": financial_data["disbursements"] if financial_data else [],
+                "grants": package["grants"],
+                "scholarships": package["scholarships"],
+                "loans": package["loans"],
+                "work_study": package["work_study"],
+                "disbursements": financial["disbursements"],
                 # Legacy simple fields for backward compatibility
-                "amount": financial_data["total_aid"] if financial_data else 0,
-                "disbursement_date": financial_data["next_disbursement"] if financial_data else None
+                "amount": financial["total_aid"],
+                "disbursement_date": financial["next_disbursement"]
             },
             
             # Housing from StarRez (detailed)
             "housing": {
-                "assignment_status": housing_data["assignment_status"] if housing_data else "Not Assigned",
-                "building": housing_data["building"] if housing_data else None,
-                "building_code": housing_data["building_code"] if housing_data else None,
-                "room": housing_data["room_number"] if housing_data else None,
-                "room_type": housing_data["room_type"] if housing_data else None,
-                "floor": housing_data["floor"] if housing_data else None,
-                "roommate_id": housing_data["roommate_id"] if housing_data else None,
-                "move_in_date": housing_data["move_in_date"] if housing_data else None,
-                "move_out_date": housing_data["move_out_date"] if housing_data else None,
-                "meal_plan": housing_data["meal_plan"] if housing_data else {},
-                "access_card": housing_data["access_card"] if housing_data else None,
-                "parking_permit": housing_data["parking_permit"] if housing_data else None
+                "assignment_status": housing["assignment_status"],
+                "building": housing["building"],
+                "building_code": housing["building_code"],
+                "room": housing["room_number"],
+                "room_type": housing["room_type"],
+                "floor": housing["floor"],
+                "roommate_id": housing["roommate_id"],
+                "move_in_date": housing["move_in_date"],
+                "move_out_date": housing["move_out_date"],
+                "meal_plan": housing["meal_plan"],
+                "access_card": housing["access_card"],
+                "parking_permit": housing["parking_permit"]
             },
             
             # Library from Ex Libris
             "library": {
-                "library_id": library_data["library_id"] if library_data else None,
-                "items_checked_out": library_data["items_checked_out"] if library_data else 0,
-                "items_overdue": library_data["items_overdue"] if library_data else 0,
-                "fines_owed": library_data["fines_owed"] if library_data else 0.0,
-                "hold_requests": library_data["hold_requests"] if library_data else 0
+                "library_id": library["library_id"],
+                "items_checked_out": library["items_checked_out"],
+                "items_overdue": library["items_overdue"],
+                "fines_owed": library["fines_owed"],
+                "hold_requests": library["hold_requests"]
             },
             
             # ESB Metadata - shows data aggregation happened
             "_esb_metadata": {
-                "aggregated_from": [
-                    "admissions" if admissions_data else None,
-                    "academic" if academic_data else None,
-                    "financial" if financial_data else None,
-                    "housing" if housing_data else None,
-                    "library" if library_data else None
-                ],
-                "systems_queried": 5,
-                "systems_responded": sum([
-                    1 if admissions_data else 0,
-                    1 if academic_data else 0,
-                    1 if financial_data else 0,
-                    1 if housing_data else 0,
-                    1 if library_data else 0
-                ]),
-                "timestamp": datetime.now().isoformat(),
-                "cache_hit": False,  # Would be True if from cache
+                "aggregated_from": responded,
+                "systems_queried": len(pairs),
+                "systems_responded": len(responded),
+                "timestamp": timestamp or datetime.now().isoformat(),
+                "cache_hit": False,
                 "data_freshness": "real-time"
             }
         }
-        
         return unified_profile
     
+    def invalidate_student_profile(self, student_id: str) -> None:
+        """Drop a cached unified profile so the next read re-queries all systems."""
+        self._profile_cache.pop(student_id, None)
+    
+    async def _call_system(self, system_id: str, fetch, *args):
+        """
+        Call one legacy system connector (single or bulk lookup), through
+        that system's circuit breaker.
+        
+        The blocking connector runs on the system's own worker pool
+        (bulkhead), so the event loop never blocks on it. Each attempt is
+        bounded by CALL_TIMEOUT; a timed-out attempt counts as a failure
+        (its worker thread finishes in the background).
+        
+        RETRY: Transient failures (TransientError, timeouts, connection
+        errors) are retried up to RETRY_ATTEMPTS in total, with jittered
+        exponential backoff. Every attempt goes through the breaker, so
+        sustained failure opens the circuit and stops the retries.
+        Connectors are read-only lookups, hence safe to repeat.
+        
+        MVP: Connectors are in-process lookups.
+        PRODUCTION: Await the subsystem's API over a shared async HTTP
+        client (pooled keep-alive connections) opened in the app lifespan.
+        
+        Raises:
+            CircuitOpenError: The system's circuit is open (fail fast)
+            PermanentError: The system rejected the call (not retried)
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._pools[system_id]
+        breaker = self._breakers[system_id]
+        for attempt in range(self.RETRY_ATTEMPTS):
+            trial = breaker.before_call()  # CircuitOpenError: fail fast, no retry
+            try:
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(pool, fetch, *args), self.CALL_TIMEOUT
+                )
+            except PermanentError:
+                breaker.record_success()  # The system answered
+                raise
+            except _RETRYABLE_ERRORS:
+                breaker.record_failure()
+                if attempt == self.RETRY_ATTEMPTS - 1:
+                    raise
+            except asyncio.CancelledError:
+                breaker.abandon_call(trial)  # Caller gave up: no verdict on the system
+                raise
+            except Exception:
+                breaker.record_failure()
+                raise
+            else:
+                breaker.record_success()
+                return result
+            delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+    
+    def close(self) -> None:
+        """Shut down the per-system worker pools (application shutdown)."""
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+    
     def get_integration_status(self) -> Dict:
         """
         Get status of all ESB integrations.
@@ -378,45 +942,37 @@ class ESBService:
         - Incident detection and alerting
         - Capacity planning
         
+        CACHING: The status is rebuilt at most once per STATUS_CACHE_TTL
+        seconds; last_health_check shows when it was produced (including
+        each system's circuit_state).
+        
         Returns:
             Dict with ESB status and connected systems
         """
+        now = time.monotonic()
+        if self._status_cache is not None and self._status_cache[0] > now:
+            return self._status_cache[1]
+        
+        status = self._build_integration_status()
+        self._status_cache = (now + self.STATUS_CACHE_TTL, status)
+        return status
+    
+    def _build_integration_status(self) -> Dict:
+        """Assemble the integration status document (uncached)."""
+        now = datetime.now().isoformat()
         return {
             "esb_status": "operational",
             "esb_provider": "Simulated (MVP) - Production: MuleSoft/Azure Service Bus",
-            "last_health_check": datetime.now().isoformat(),
-            "connected_systems": self._systems,
-            "message_flow": {
-                "daily_messages": 15420,
-                "success_rate": 99.7,
-                "avg_latency_ms": 45,
-                "queue_depth": 12
-            },
-            "security": {
-                "authentication": "OAuth2 + Service Accounts",
-                "encryption": "TLS 1.3 in transit, AES-256 at rest",
-                "audit_logging": "enabled"
-            },
-            "architecture_notes": {
-                "pattern": "Hub-and-Spoke ESB",
-                "cloud_components": [
-                    "API Gateway",
-                    "AI Service",
-                    "Analytics Pipeline",
-                    "Cache Layer"
-                ],
-                "on_premise_components": [
-                    "Admissions System (Banner)",
-                    "Academic Records (PeopleSoft)",
-                    "Financial Aid (PowerFAIDS)",
-                    "Housing (StarRez)",
-                    "Directory Services (AD/LDAP)"
-                ],
-                "why_hybrid": (
-                    "Student data systems remain on-premise for FERPA/PCI compliance. "
-                    "Cloud provides scalable AI processing and modern API layer."
-                )
-            }
+            "last_health_check": now,
+            "connected_systems": [
+                {
+                    **system,
+                    "last_sync": now,
+                    "circuit_state": self._breakers[system["id"]].state
+                }
+                for system in self._systems
+            ],
+            **_STATUS_STATIC_SECTIONS
         }
     
     def simulate_system_call(
@@ -446,10 +1002,7 @@ class ESBService:
             Dict with operation result
         """
         # Find system configuration
-        system = next(
-            (s for s in self._systems if s["id"] == system_id),
-            None
-        )
+        system = self._systems_by_id.get(system_id)
         
         if not system:
             return {
@@ -457,6 +1010,15 @@ class ESBService:
                 "error": f"System {system_id} not found in ESB configuration"
             }
         
+        breaker = self._breakers[system_id]
+        if breaker.state == "open":
+            return {
+                "success": False,
+                "system": system_id,
+                "error": f"Circuit open for {system['name']}: failing fast",
+                "circuit_state": "open"
+            }
+        
         # Simulate successful call
         return {
             "success": True,
@@ -29,8 +29,10 @@ ESCALATION FLOW:
 
 TICKET STATUSES:
 ---------------
-- OPEN: New ticket, awaiting staff assignment
-- IN_PROGRESS: Staff is working on it
+- OPEN: Awaiting staff assignment. New tickets are auto-routed on
+  creation, so a ticket only stays OPEN when no active staff member
+  could take it; staff can then claim it
+- IN_PROGRESS: Assigned to staff (auto-routed or claimed), being worked on
 - PENDING_STUDENT: Waiting for student response
 - RESOLVED: Issue resolved
 - CLOSED: Ticket closed (with or without resolution)
@@ -44,9 +46,15 @@ PRODUCTION NOTES:
 ================================================================================
 """
 
+import bisect
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
+import orjson
+import os
+import queue
+import threading
 import uuid
 
 
@@ -67,6 +75,53 @@ class TicketPriority(str, Enum):
     URGENT = "urgent"
 
 
+# Plain string values for the ticket write paths (Enum member access goes
+# through the metaclass on every use)
+_OPEN = TicketStatus.OPEN.value
+_IN_PROGRESS = TicketStatus.IN_PROGRESS.value
+_PENDING_STUDENT = TicketStatus.PENDING_STUDENT.value
+_RESOLVED = TicketStatus.RESOLVED.value
+_HIGH = TicketPriority.HIGH.value
+_MEDIUM = TicketPriority.MEDIUM.value
+
+
+# Staff department with the skills for each ticket category. Tickets in
+# other categories are still routed, on workload and performance alone.
+CATEGORY_DEPARTMENTS = {
+    "financial_aid": "Financial Aid Office",
+    "financial_aid_appeal": "Financial Aid Office",
+    "registration": "Academic Advising",
+    "grades": "Academic Advising"
+}
+
+# Load the demo tickets into an empty ticket store (DEMO_TICKETS=false
+# starts with no tickets, e.g. in production)
+DEMO_TICKETS = os.getenv("DEMO_TICKETS", "true").lower() in ("1", "true", "yes")
+
+# Ticket subjects for the categories the AI service classifies into;
+# other (manually entered) categories are formatted on demand
+_TICKET_SUBJECTS = {
+    category: f"{category.replace('_', ' ').title()} Query"
+    for category in (
+        "admissions", "financial_aid", "registration", "grades", "housing",
+        "support", "career", "library", "general",
+        "financial_aid_appeal", "complaint", "emergency"
+    )
+}
+
+
+def _ticket_subject(category: str) -> str:
+    """Display subject for a new ticket in the given category."""
+    subject = _TICKET_SUBJECTS.get(category)
+    if subject is None:
+        subject = f"{category.replace('_', ' ').title()} Query"
+    return subject
+
+
+# Statuses in which a ticket still counts toward its assignee's workload
+_ACTIVE_STATUSES = frozenset({_OPEN, _IN_PROGRESS, _PENDING_STUDENT})
+
+
 class EscalationService:
     """
     Service for managing query escalations and support tickets.
@@ -78,6 +133,21 @@ class EscalationService:
     # Confidence threshold for auto-escalation
     ESCALATION_THRESHOLD = 0.70
     
+    # Categories that should always have human review option
+    _SENSITIVE_CATEGORIES = frozenset({"financial_aid_appeal", "complaint", "emergency"})
+    
+    # Categories whose tickets start at HIGH priority
+    _HIGH_PRIORITY_CATEGORIES = frozenset({"financial_aid", "emergency"})
+    
+    # Auto-assignment score weights (see find_best_technician)
+    ROUTING_SKILL_WEIGHT = 0.4
+    ROUTING_LOAD_WEIGHT = 0.3
+    ROUTING_PERFORMANCE_WEIGHT = 0.2
+    ROUTING_AVAILABILITY_WEIGHT = 0.1
+    
+    # Active tickets at which a staff member stops counting as available
+    STAFF_CAPACITY = 20
+    
     def __init__(self, db):
         """
         Initialize escalation service.
@@ -87,12 +157,62 @@ class EscalationService:
         """
         self.db = db
         
-        # Initialize tickets storage if not exists
-        if not hasattr(db, 'tickets'):
-            db.tickets = {}
-        
-        # Initialize with some sample escalated tickets for demo
-        self._init_sample_tickets()
+        # Initialize with some sample escalated tickets for demo, only into
+        # an empty store: never overwrite tickets already in the database
+        if DEMO_TICKETS and not db.tickets:
+            self._init_sample_tickets()
+        
+        # Ticket numbers come from a counter that only moves forward, so
+        # IDs never collide (len(db.tickets) + 1 would reuse numbers)
+        for ticket_id in db.tickets:
+            db.ticket_seq = max(db.ticket_seq, int(ticket_id.rsplit("-", 1)[1]))
+        
+        # Secondary indexes: key → ticket IDs, as insertion-ordered sets
+        # (dict keys), so per-staff / per-student / per-status lookups
+        # touch only the matching tickets instead of scanning them all.
+        # Kept current by create_ticket, assign_ticket, add_message and
+        # resolve_ticket. Owned by this service, like its aggregates; the
+        # shared database only holds the tickets.
+        # PRODUCTION: Database indexes on assigned_to, student_id, status
+        self.tickets_by_assignee: Dict[str, Dict[str, None]] = {}
+        self.tickets_by_student: Dict[str, Dict[str, None]] = {}
+        self.tickets_by_status: Dict[str, Dict[str, None]] = {}
+        # All tickets as (created_at, ticket_id), kept sorted on insert:
+        # the unfiltered ticket list is read newest-first without sorting
+        self.tickets_sorted: List[Tuple[str, str]] = []
+        
+        # Dashboard aggregates, maintained with the indexes (status counts
+        # are the sizes of the tickets_by_status buckets)
+        self._category_counts: Counter = Counter()
+        self._confidence_total = 0.0
+        
+        # Routing state: active tickets per staff member, and when each
+        # was last auto-assigned (ties go to the longest idle: round-robin)
+        self._open_count_by_staff: Counter = Counter()
+        self._last_assigned: Dict[str, int] = {}
+        self._assignments = 0
+        
+        # Encoded JSON per ticket for the read-heavy list endpoints,
+        # dropped whenever the ticket changes (see tickets_json)
+        self._ticket_json: Dict[str, bytes] = {}
+        
+        # Ticket notifications (student/staff emails) leave the request
+        # path: _notify() enqueues and a notifier thread sends them in
+        # batches. The app lifespan starts and stops the notifier
+        # (start_notifier / stop_notifier); without one, or if the queue
+        # is full, events are sent synchronously, so load slows writers
+        # down instead of growing memory.
+        # MVP: "Sending" appends to the db.notifications outbox.
+        # PRODUCTION: One SendGrid/Twilio batch call per window
+        self.NOTIFY_QUEUE_SIZE = 10000
+        self.NOTIFY_BATCH_SIZE = 64
+        self.NOTIFY_FLUSH_INTERVAL = 0.1  # seconds
+        self._notify_queue: "queue.Queue[Dict]" = queue.Queue(maxsize=self.NOTIFY_QUEUE_SIZE)
+        self._notify_stop = threading.Event()
+        self._notifier: Optional[threading.Thread] = None
+        
+        for ticket in db.tickets.values():
+            self._reindex(ticket)
     
     def _init_sample_tickets(self):
         """Create sample tickets for demonstration."""
@@ -230,7 +350,7 @@ class EscalationService:
                 "resolution_notes": None
             },
             {
-                "id": "TKT-2025-003",
+                "id": "TKT-2025-004",
                 "student_id": "STU2024003",
                 "student_name": "Emily Rodriguez",
                 "student_email": "emily.rodriguez@techedu.edu",
@@ -291,16 +411,11 @@ class EscalationService:
         Returns:
             True if should escalate
         """
-        # Always escalate low confidence queries
-        if confidence < self.ESCALATION_THRESHOLD:
-            return True
-        
-        # Categories that should always have human review option
-        sensitive_categories = ["financial_aid_appeal", "complaint", "emergency"]
-        if category in sensitive_categories:
-            return True
-        
-        return False
+        # Always escalate low confidence queries, and sensitive categories
+        return (
+            confidence < self.ESCALATION_THRESHOLD
+            or category in self._SENSITIVE_CATEGORIES
+        )
     
     def create_ticket(
         self,
@@ -313,6 +428,10 @@ class EscalationService:
         """
         Create a new support ticket for escalated query.
         
+        The ticket is created OPEN and immediately auto-routed
+        (auto_assign), so it is normally returned IN_PROGRESS with an
+        assignee; it stays OPEN only if no active staff member exists.
+        
         Args:
             student_id: Student's ID
             query: Original student query
@@ -321,22 +440,22 @@ class EscalationService:
             category: Query category
             
         Returns:
-            Created ticket dict
+            Created ticket dict (IN_PROGRESS once auto-assigned)
         """
         # Get student info
         student = self.db.students.get(student_id, {})
         
         # Generate ticket ID
-        ticket_count = len(self.db.tickets) + 1
-        ticket_id = f"TKT-2025-{ticket_count:03d}"
+        self.db.ticket_seq += 1
+        ticket_id = f"TKT-2025-{self.db.ticket_seq:03d}"
         
         # Determine priority based on category and confidence
         if ai_confidence < 0.3:
-            priority = TicketPriority.HIGH.value
-        elif category in ["financial_aid", "emergency"]:
-            priority = TicketPriority.HIGH.value
+            priority = _HIGH
+        elif category in self._HIGH_PRIORITY_CATEGORIES:
+            priority = _HIGH
         else:
-            priority = TicketPriority.MEDIUM.value
+            priority = _MEDIUM
         
         now = datetime.now().isoformat()
         
@@ -345,12 +464,12 @@ class EscalationService:
             "student_id": student_id,
             "student_name": student.get("name", "Unknown"),
             "student_email": student.get("email", "unknown@techedu.edu"),
-            "subject": f"{category.replace('_', ' ').title()} Query",
+            "subject": _ticket_subject(category),
             "original_query": query,
             "ai_response": ai_response,
             "ai_confidence": ai_confidence,
             "category": category,
-            "status": TicketStatus.OPEN.value,
+            "status": _OPEN,
             "priority": priority,
             "assigned_to": None,
             "created_at": now,
@@ -370,9 +489,209 @@ class EscalationService:
             "resolution_notes": None
         }
         
+        previous = self.db.tickets.get(ticket_id)
+        if previous is not None:
+            self._unindex(previous)
         self.db.tickets[ticket_id] = ticket
+        self._ticket_json.pop(ticket_id, None)
+        self._reindex(ticket)
+        self._notify("ticket_created", ticket, ticket["student_email"])
+        self.auto_assign(ticket)
         return ticket
     
+    def auto_assign(self, ticket: Dict) -> Optional[str]:
+        """
+        Route a new ticket to the best-scoring staff member.
+        
+        PRODUCTION: Skill-based routing in the CRM (ServiceNow/Salesforce)
+        
+        Returns:
+            Assigned staff email, or None if no staff is available
+        """
+        staff_email = self.find_best_technician(ticket)
+        if staff_email is None:
+            return None
+        self._assignments += 1
+        self._last_assigned[staff_email] = self._assignments
+        self.assign_ticket(ticket["id"], staff_email)
+        return staff_email
+    
+    def find_best_technician(self, ticket: Dict) -> Optional[str]:
+        """
+        Pick the staff member best suited to a ticket, in one scoring pass.
+        
+        score = 0.4 × skill        (1 if in the category's department)
+              + 0.3 × (1 - load)   (active tickets / busiest candidate's)
+              + 0.2 × performance  (share of own tickets already closed)
+              + 0.1 × availability (1 while under STAFF_CAPACITY)
+        
+        Only active staff accounts are candidates. Ties go to whoever was
+        auto-assigned least recently (round-robin).
+        """
+        department = CATEGORY_DEPARTMENTS.get(ticket["category"])
+        candidates = [
+            (username, department is not None and user.get("department") == department)
+            for username, user in self.db.users.items()
+            if user.get("role") == "staff" and user.get("is_active", True)
+        ]
+        if not candidates:
+            return None
+        
+        open_counts = self._open_count_by_staff
+        by_assignee = self.tickets_by_assignee
+        max_load = max(max(open_counts[username] for username, _ in candidates), 1)
+        
+        best, best_key = None, None
+        for username, skilled in candidates:
+            load = open_counts[username]
+            handled = len(by_assignee.get(username, ()))
+            performance = (handled - load) / handled if handled else 0.5
+            score = (
+                self.ROUTING_SKILL_WEIGHT * skilled
+                + self.ROUTING_LOAD_WEIGHT * (1 - load / max_load)
+                + self.ROUTING_PERFORMANCE_WEIGHT * performance
+                + self.ROUTING_AVAILABILITY_WEIGHT * (load < self.STAFF_CAPACITY)
+            )
+            key = (score, -self._last_assigned.get(username, -1))
+            if best_key is None or key > best_key:
+                best, best_key = username, key
+        return best
+    
+    def _reindex(
+        self,
+        ticket: Dict,
+        old_status: Optional[str] = None,
+        old_assignee: Optional[str] = None
+    ) -> None:
+        """
+        Bring the secondary indexes up to date for one ticket.
+        
+        New tickets are called without old values; updates pass the status
+        and assignee the ticket had before the change.
+        """
+        ticket_id = ticket["id"]
+        status = ticket["status"]
+        if status != old_status:
+            if old_status is not None:
+                self.tickets_by_status[old_status].pop(ticket_id, None)
+            self.tickets_by_status.setdefault(status, {})[ticket_id] = None
+        
+        assignee = ticket.get("assigned_to")
+        if assignee != old_assignee:
+            if old_assignee is not None:
+                self.tickets_by_assignee[old_assignee].pop(ticket_id, None)
+            if assignee is not None:
+                self.tickets_by_assignee.setdefault(assignee, {})[ticket_id] = None
+        
+        was_active = old_status in _ACTIVE_STATUSES
+        is_active = status in _ACTIVE_STATUSES
+        if (was_active, old_assignee) != (is_active, assignee):
+            if was_active and old_assignee is not None:
+                self._open_count_by_staff[old_assignee] -= 1
+            if is_active and assignee is not None:
+                self._open_count_by_staff[assignee] += 1
+        
+        if old_status is None:  # New ticket: student, category, confidence never change
+            self.tickets_by_student.setdefault(ticket.get("student_id"), {})[ticket_id] = None
+            bisect.insort(self.tickets_sorted, (ticket["created_at"], ticket_id))
+            self._category_counts[ticket.get("category", "other")] += 1
+            self._confidence_total += ticket.get("ai_confidence", 0)
+    
+    def _unindex(self, ticket: Dict) -> None:
+        """Remove a ticket from every secondary index."""
+        ticket_id = ticket["id"]
+        self.tickets_by_status.get(ticket["status"], {}).pop(ticket_id, None)
+        self.tickets_by_assignee.get(ticket.get("assigned_to"), {}).pop(ticket_id, None)
+        self.tickets_by_student.get(ticket.get("student_id"), {}).pop(ticket_id, None)
+        position = bisect.bisect_left(self.tickets_sorted, (ticket["created_at"], ticket_id))
+        if self.tickets_sorted[position:position + 1] == [(ticket["created_at"], ticket_id)]:
+            del self.tickets_sorted[position]
+        category = ticket.get("category", "other")
+        self._category_counts[category] -= 1
+        if not self._category_counts[category]:
+            del self._category_counts[category]
+        self._confidence_total -= ticket.get("ai_confidence", 0)
+        if ticket["status"] in _ACTIVE_STATUSES and ticket.get("assigned_to") is not None:
+            self._open_count_by_staff[ticket["assigned_to"]] -= 1
+    
+    def _notify(self, event: str, ticket: Dict, recipient: Optional[str]) -> None:
+        """Queue a notification about a ticket change for its recipient."""
+        if recipient is None:
+            return
+        notification = {
+            "event": event,
+            "ticket_id": ticket["id"],
+            "recipient": recipient,
+            "timestamp": ticket["updated_at"]
+        }
+        if self._notifier is None:
+            self._send_notifications([notification])
+            return
+        try:
+            self._notify_queue.put_nowait(notification)
+        except queue.Full:
+            self._send_notifications([notification])  # Degrade to synchronous
+    
+    def start_notifier(self) -> None:
+        """Start the background notification sender (app startup); no-op if running."""
+        if self._notifier is not None:
+            return
+        self._notify_stop.clear()
+        self._notifier = threading.Thread(
+            target=self._drain_notifications, name="ticket-notifier", daemon=True
+        )
+        self._notifier.start()
+    
+    def stop_notifier(self) -> None:
+        """
+        Stop the background sender and send whatever is still queued (app
+        shutdown). Later notifications are sent synchronously.
+        """
+        notifier = self._notifier
+        if notifier is None:
+            return
+        self._notify_stop.set()
+        notifier.join()
+        self._notifier = None
+        self.flush_notifications()
+    
+    def _drain_notifications(self) -> None:
+        """
+        Background sender: deliver queued notifications in batches of up
+        to NOTIFY_BATCH_SIZE, pausing NOTIFY_FLUSH_INTERVAL between partial
+        batches so bursts coalesce into one send. Exits once _notify_stop
+        is set.
+        """
+        notify_queue = self._notify_queue
+        while not self._notify_stop.is_set():
+            try:
+                batch = [notify_queue.get(timeout=self.NOTIFY_FLUSH_INTERVAL)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.NOTIFY_BATCH_SIZE:
+                try:
+                    batch.append(notify_queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._send_notifications(batch)
+            if len(batch) < self.NOTIFY_BATCH_SIZE:
+                self._notify_stop.wait(self.NOTIFY_FLUSH_INTERVAL)
+    
+    def flush_notifications(self) -> None:
+        """Send any still-queued notifications now (stop_notifier at shutdown)."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._notify_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._send_notifications(batch)
+    
+    def _send_notifications(self, batch: List[Dict]) -> None:
+        """Deliver one batch of notifications (MVP: append to the outbox)."""
+        self.db.notifications.extend(batch)
+    
     def get_all_tickets(self, status_filter: str = None) -> List[Dict]:
         """
         Get all tickets, optionally filtered by status.
@@ -383,15 +702,37 @@ class EscalationService:
         Returns:
             List of tickets
         """
-        tickets = list(self.db.tickets.values())
-        
-        if status_filter:
-            tickets = [t for t in tickets if t["status"] == status_filter]
+        tickets = self.db.tickets
+        if not status_filter:
+            # Already ordered by created_at: read it back newest first
+            return [tickets[ticket_id] for _, ticket_id in reversed(self.tickets_sorted)]
+        
+        filtered = [
+            tickets[ticket_id]
+            for ticket_id in self.tickets_by_status.get(status_filter, ())
+        ]
         
         # Sort by created_at descending (newest first)
-        tickets.sort(key=lambda x: x["created_at"], reverse=True)
+        filtered.sort(key=lambda x: x["created_at"], reverse=True)
+        
+        return filtered
+    
+    def tickets_json(self, tickets: List[Dict]) -> bytes:
+        """
+        Encode a ticket list as a JSON array, reusing each ticket's bytes.
         
-        return tickets
+        Tickets change rarely while dashboards poll often, so each one is
+        encoded once with orjson and the bytes are kept until the next
+        create/assign/message/resolve on that ticket.
+        """
+        cache = self._ticket_json
+        parts = []
+        for ticket in tickets:
+            encoded = cache.get(ticket["id"])
+            if encoded is None:
+                encoded = cache[ticket["id"]] = orjson.dumps(ticket)
+            parts.append(encoded)
+        return b"[" + b",".join(parts) + b"]"
     
     def get_ticket(self, ticket_id: str) -> Optional[Dict]:
         """Get a specific ticket by ID."""
@@ -400,15 +741,15 @@ class EscalationService:
     def get_staff_tickets(self, staff_email: str) -> List[Dict]:
         """Get tickets assigned to a specific staff member."""
         return [
-            t for t in self.db.tickets.values()
-            if t.get("assigned_to") == staff_email
+            self.db.tickets[ticket_id]
+            for ticket_id in self.tickets_by_assignee.get(staff_email, ())
         ]
     
     def get_student_tickets(self, student_id: str) -> List[Dict]:
         """Get tickets for a specific student."""
         return [
-            t for t in self.db.tickets.values()
-            if t.get("student_id") == student_id
+            self.db.tickets[ticket_id]
+            for ticket_id in self.tickets_by_student.get(student_id, ())
         ]
     
     def assign_ticket(self, ticket_id: str, staff_email: str) -> Optional[Dict]:
@@ -426,17 +767,23 @@ class EscalationService:
         if not ticket:
             return None
         
+        now = datetime.now().isoformat()  # One timestamp for the whole update
+        self._ticket_json.pop(ticket_id, None)
+        old_status, old_assignee = ticket["status"], ticket.get("assigned_to")
         ticket["assigned_to"] = staff_email
-        ticket["status"] = TicketStatus.IN_PROGRESS.value
-        ticket["updated_at"] = datetime.now().isoformat()
+        ticket["status"] = _IN_PROGRESS
+        ticket["updated_at"] = now
+        self._reindex(ticket, old_status, old_assignee)
         
         # Add system message
         staff_name = self.db.users.get(staff_email, {}).get("name", "Staff")
         ticket["messages"].append({
             "sender": "system",
             "message": f"Ticket assigned to {staff_name}.",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         })
+        self._notify("ticket_assigned", ticket, ticket.get("student_email"))
+        self._notify("ticket_assigned", ticket, staff_email)
         
         return ticket
     
@@ -463,6 +810,9 @@ class EscalationService:
         if not ticket:
             return None
         
+        now = datetime.now().isoformat()  # One timestamp for the whole update
+        self._ticket_json.pop(ticket_id, None)
+        
         # Get sender name
         sender_info = self.db.users.get(sender_email, {})
         sender_name = sender_info.get("name", "Unknown")
@@ -471,17 +821,27 @@ class EscalationService:
             "sender": sender_type,
             "sender_name": sender_name if sender_type == "staff" else None,
             "message": message,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }
         
         ticket["messages"].append(msg)
-        ticket["updated_at"] = datetime.now().isoformat()
+        ticket["updated_at"] = now
+        
+        # Update status based on who sent (indexes only if it changes)
+        old_status = new_status = ticket["status"]
+        if sender_type == "staff":
+            new_status = _PENDING_STUDENT
+        elif sender_type == "student":
+            new_status = _IN_PROGRESS
+        if new_status != old_status:
+            ticket["status"] = new_status
+            self._reindex(ticket, old_status, ticket.get("assigned_to"))
         
-        # Update status based on who sent
+        # Tell the other party
         if sender_type == "staff":
-            ticket["status"] = TicketStatus.PENDING_STUDENT.value
+            self._notify("staff_reply", ticket, ticket.get("student_email"))
         elif sender_type == "student":
-            ticket["status"] = TicketStatus.IN_PROGRESS.value
+            self._notify("student_reply", ticket, ticket.get("assigned_to"))
         
         return ticket
     
@@ -504,43 +864,44 @@ class EscalationService:
         if not ticket:
             return None
         
-        ticket["status"] = TicketStatus.RESOLVED.value
+        now = datetime.now().isoformat()  # One timestamp for the whole update
+        self._ticket_json.pop(ticket_id, None)
+        old_status = ticket["status"]
+        ticket["status"] = _RESOLVED
+        self._reindex(ticket, old_status, ticket.get("assigned_to"))
         ticket["resolution_notes"] = resolution_notes
-        ticket["updated_at"] = datetime.now().isoformat()
+        ticket["updated_at"] = now
         
         ticket["messages"].append({
             "sender": "system",
             "message": f"Ticket resolved. Resolution: {resolution_notes}",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         })
+        self._notify("ticket_resolved", ticket, ticket.get("student_email"))
         
         return ticket
     
     def get_escalation_stats(self) -> Dict:
-        """Get escalation statistics for dashboard."""
-        tickets = list(self.db.tickets.values())
-        
-        open_tickets = len([t for t in tickets if t["status"] == TicketStatus.OPEN.value])
-        in_progress = len([t for t in tickets if t["status"] == TicketStatus.IN_PROGRESS.value])
-        resolved = len([t for t in tickets if t["status"] == TicketStatus.RESOLVED.value])
+        """
+        Get escalation statistics for dashboard.
         
-        # Category breakdown
-        categories = {}
-        for t in tickets:
-            cat = t.get("category", "other")
-            categories[cat] = categories.get(cat, 0) + 1
+        Read from the aggregates kept current as tickets change: no pass
+        over the tickets.
         
-        # Average confidence of escalated queries
-        confidences = [t.get("ai_confidence", 0) for t in tickets]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        "open" is the unassigned backlog: tickets auto-routing could not
+        place (no active staff). Routed tickets count as "in_progress".
+        """
+        by_status = self.tickets_by_status
+        total = len(self.db.tickets)
+        avg_confidence = self._confidence_total / total if total else 0
         
         return {
-            "total_tickets": len(tickets),
-            "open": open_tickets,
-            "in_progress": in_progress,
-            "resolved": resolved,
-            "pending_student": len([t for t in tickets if t["status"] == TicketStatus.PENDING_STUDENT.value]),
-            "by_category": categories,
+            "total_tickets": total,
+            "open": len(by_status.get(_OPEN, ())),
+            "in_progress": len(by_status.get(_IN_PROGRESS, ())),
+            "resolved": len(by_status.get(_RESOLVED, ())),
+            "pending_student": len(by_status.get(_PENDING_STUDENT, ())),
+            "by_category": dict(self._category_counts),
             "avg_escalation_confidence": round(avg_confidence, 2),
             "escalation_rate": "27%",  # Simulated
             "avg_resolution_time": "4.2 hours"  # Simulated
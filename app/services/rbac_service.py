@@ -46,7 +46,8 @@ PERMISSIONS MODEL:
 """
 
 from enum import Enum
-from typing import List, Dict, Optional, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping
 from fastapi import HTTPException, status
 
 
@@ -80,21 +81,32 @@ class Permission(str, Enum):
     SYSTEM_CONFIG = "system_config"
 
 
-# Role to Permission mapping
-ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
-    Role.STUDENT: {
+# Role value -> Role; unknown strings fall back to STUDENT via .get()
+_ROLE_BY_STR: Dict[str, Role] = {r.value: r for r in Role}
+
+
+# 403 detail per permission, formatted once
+_DENIED_DETAIL: Dict[Permission, str] = {
+    p: f"Permission denied: {p.value} required" for p in Permission
+}
+
+
+# Role to Permission mapping (read-only: RBACService caches per-user
+# permission sets from it, so it must not change at runtime)
+ROLE_PERMISSIONS: Mapping[Role, FrozenSet[Permission]] = MappingProxyType({
+    Role.STUDENT: frozenset({
         Permission.VIEW_OWN_PROFILE,
         Permission.SUBMIT_QUERY,
         Permission.VIEW_OWN_HISTORY,
-    },
-    Role.STAFF: {
+    }),
+    Role.STAFF: frozenset({
         Permission.VIEW_OWN_PROFILE,
         Permission.SUBMIT_QUERY,
         Permission.VIEW_OWN_HISTORY,
         Permission.VIEW_ANY_STUDENT,
         Permission.VIEW_ANALYTICS,
-    },
-    Role.ADMIN: {
+    }),
+    Role.ADMIN: frozenset({
         Permission.VIEW_OWN_PROFILE,
         Permission.SUBMIT_QUERY,
         Permission.VIEW_OWN_HISTORY,
@@ -107,8 +119,8 @@ ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
         Permission.VIEW_LEGACY_SYSTEMS,
         Permission.MANAGE_USERS,
         Permission.SYSTEM_CONFIG,
-    }
-}
+    }),
+})
 
 
 class RBACService:
@@ -129,6 +141,24 @@ class RBACService:
             db: MockDatabase instance
         """
         self.db = db
+        
+        # username -> Role and username -> permissions, precomputed for
+        # every known user here (and filled on first lookup for users
+        # added later). Authorization runs several times per request, so
+        # a check is one dict hit plus frozenset membership. Only known
+        # users are cached (unknown names can't grow it).
+        # PRODUCTION: Call invalidate_user() when a user's role changes.
+        self._role_cache: Dict[str, Role] = {}
+        self._permission_cache: Dict[str, FrozenSet[Permission]] = {}
+        for username, user in db.users.items():
+            self._cache_user(username, user)
+    
+    def _cache_user(self, username: str, user: Dict) -> Role:
+        """Resolve and cache a known user's role and permission set."""
+        role = _ROLE_BY_STR.get(user.get("role"), Role.STUDENT)
+        self._role_cache[username] = role
+        self._permission_cache[username] = ROLE_PERMISSIONS[role]
+        return role
     
     def get_user_role(self, username: str) -> Role:
         """
@@ -140,14 +170,26 @@ class RBACService:
         Returns:
             Role enum value
         """
-        user = self.db.users.get(username, {})
-        role_str = user.get("role", "student")
-        try:
-            return Role(role_str)
-        except ValueError:
+        role = self._role_cache.get(username)
+        if role is not None:
+            return role
+        
+        user = self.db.users.get(username)
+        if user is None:
             return Role.STUDENT
+        return self._cache_user(username, user)
     
-    def get_permissions(self, username: str) -> Set[Permission]:
+    def invalidate_user(self, username: str) -> None:
+        """
+        Drop a user's cached role and permissions.
+        
+        Must be called whenever self.db.users[username]["role"] changes
+        (or the user is removed) so the next check sees the new role.
+        """
+        self._role_cache.pop(username, None)
+        self._permission_cache.pop(username, None)
+    
+    def get_permissions(self, username: str) -> FrozenSet[Permission]:
         """
         Get all permissions for a user.
         
@@ -155,10 +197,12 @@ class RBACService:
             username: User's email/username
             
         Returns:
-            Set of Permission values
+            Frozen set of Permission values (shared; do not mutate)
         """
-        role = self.get_user_role(username)
-        return ROLE_PERMISSIONS.get(role, set())
+        permissions = self._permission_cache.get(username)
+        if permissions is None:
+            permissions = ROLE_PERMISSIONS[self.get_user_role(username)]
+        return permissions
     
     def has_permission(self, username: str, permission: Permission) -> bool:
         """
@@ -171,8 +215,7 @@ class RBACService:
         Returns:
             True if user has permission
         """
-        permissions = self.get_permissions(username)
-        return permission in permissions
+        return permission in self.get_permissions(username)
     
     def check_permission(self, username: str, permission: Permission) -> None:
         """
@@ -188,7 +231,7 @@ class RBACService:
         if not self.has_permission(username, permission):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied: {permission.value} required"
+                detail=_DENIED_DETAIL[permission]
             )
     
     def can_view_student(self, username: str, target_student_id: str) -> bool:
@@ -207,31 +250,27 @@ class RBACService:
         Returns:
             True if access allowed
         """
-        user = self.db.users.get(username, {})
         role = self.get_user_role(username)
         
-        # Admin can view all
-        if role == Role.ADMIN:
-            return True
-        
-        # Staff can view any student
-        if role == Role.STAFF:
+        # Admin and staff can view any student (cached role, no user lookup)
+        if role is Role.ADMIN or role is Role.STAFF:
             return True
         
         # Students can only view themselves
-        if role == Role.STUDENT:
+        if role is Role.STUDENT:
+            user = self.db.users.get(username, {})
             return user.get("student_id") == target_student_id
         
         return False
     
     def is_admin(self, username: str) -> bool:
         """Check if user is admin."""
-        return self.get_user_role(username) == Role.ADMIN
+        return self.get_user_role(username) is Role.ADMIN
     
     def is_staff_or_admin(self, username: str) -> bool:
         """Check if user is staff or admin."""
         role = self.get_user_role(username)
-        return role in [Role.STAFF, Role.ADMIN]
+        return role is Role.STAFF or role is Role.ADMIN
     
     @staticmethod
     def get_role_from_dict(user: Dict) -> Role:
@@ -244,8 +283,4 @@ class RBACService:
         Returns:
             Role enum value
         """
-        role_str = user.get("role", "student")
-        try:
-            return Role(role_str)
-        except ValueError:
-            return Role.STUDENT
+        return _ROLE_BY_STR.get(user.get("role"), Role.STUDENT)